@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import chain, combinations
+from typing import Mapping, Sequence
+
+import numpy as np
+
+from ...model.game import Coalition
+
+
+@dataclass(frozen=True)
+class PairLayout:
+    """Singleton/pair enumeration shared by the axiom counters.
+
+    singletons: {i} for each player, in roster order.
+    two_sets: {i, j} for each pair, in ``combinations(players, 2)`` order.
+    pair_lo / pair_hi: roster positions of each pair's smaller / larger member.
+    """
+
+    singletons: tuple[Coalition, ...]
+    two_sets: tuple[Coalition, ...]
+    pair_lo: np.ndarray
+    pair_hi: np.ndarray
+
+    def singleton_values(self, mapping: Mapping[Coalition, float]) -> np.ndarray:
+        """Values of the singletons as a float array (NaN where missing)."""
+        return _lookup(mapping, self.singletons)
+
+    def pair_values(self, mapping: Mapping[Coalition, float]) -> np.ndarray:
+        """Values of the pairs as a float array (NaN where missing)."""
+        return _lookup(mapping, self.two_sets)
+
+
+def pair_layout(players: Sequence[int]) -> PairLayout:
+    """Return the (cached) pair layout for a player roster."""
+    return _pair_layout(tuple(players))
+
+
+@lru_cache(maxsize=64)
+def _pair_layout(players: tuple[int, ...]) -> PairLayout:
+    n = len(players)
+    ends = np.fromiter(
+        chain.from_iterable(combinations(range(n), 2)),
+        dtype=np.intp,
+        count=n * (n - 1),
+    ).reshape(-1, 2)
+    # Put the member with the smaller player id first.
+    ids = np.array(players, dtype=np.int64)
+    swap = ids[ends[:, 0]] > ids[ends[:, 1]]
+    ends[swap] = ends[swap, ::-1]
+    # The layout is shared between calls, so its arrays must stay immutable.
+    ends.setflags(write=False)
+    return PairLayout(
+        singletons=tuple(frozenset({p}) for p in players),
+        two_sets=tuple(
+            frozenset({players[a], players[b]}) for a, b in ends.tolist()
+        ),
+        pair_lo=ends[:, 0],
+        pair_hi=ends[:, 1],
+    )
+
+
+def _lookup(
+    mapping: Mapping[Coalition, float], keys: tuple[Coalition, ...]
+) -> np.ndarray:
+    return np.fromiter(
+        (mapping.get(k, np.nan) for k in keys), dtype=np.float64, count=len(keys)
+    )
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from itertools import combinations
 from typing import Mapping
 
+import numpy as np
+
 from ...model.game import Coalition, Game
+from .pairs import pair_layout
+from .tally import RuleTally
 
 
 def update_sada_counts(
@@ -16,79 +19,73 @@ def update_sada_counts(
     if ranks is None:
         return
 
-    players = list(game.players)
-
-    two_sets: list[Coalition] = [
-        frozenset({i, j}) for i, j in combinations(players, 2)
-    ]
-
-    def _level(T: Coalition) -> int | None:
-        """Synergy level in {1,...,6} or None if undefined."""
-        if len(T) != 2:
-            return None
-        i, j = sorted(T)
-        A, B, P = frozenset({i}), frozenset({j}), frozenset({i, j})
-        if A not in ranks or B not in ranks or P not in ranks:
-            return None
-
-        def succeq(X: Coalition, Y: Coalition) -> bool:
-            return ranks[X] <= ranks[Y]
-
-        def succ(X: Coalition, Y: Coalition) -> bool:
-            return ranks[X] < ranks[Y]
-
-        def sim(X: Coalition, Y: Coalition) -> bool:
-            return ranks[X] == ranks[Y]
-
-        if sim(P, A) and sim(A, B):
-            return 3
-
-        for p1, p2 in ((i, j), (j, i)):
-            C1, C2 = frozenset({p1}), frozenset({p2})
-
-            if succ(P, C1) and succeq(C1, C2):
-                return 1
-            if sim(P, C1) and succ(C1, C2):
-                return 2
-            if succ(C1, P) and succ(P, C2):
-                return 4
-            if succ(C1, P) and sim(P, C2):
-                return 5
-            if succeq(C1, C2) and succ(C2, P):
-                return 6
-
-        return None
-
-    levels: dict[Coalition, int] = {}
-    for T in two_sets:
-        level = _level(T)
-        if level is not None:
-            levels[T] = level
-
-    for rule_name in synergy_rules:
-        counts.setdefault(rule_name, {"triggered": 0, "satisfied": 0})
-
-    for T in two_sets:
-        if T not in levels:
-            continue
-        for U in two_sets:
-            if U == T or U not in levels:
-                continue
-            if levels[T] >= levels[U]:
-                continue
-
-            for rule_name, scores in synergy_rules.items():
-                vT = scores.get(T)
-                vU = scores.get(U)
-                if vT is None or vU is None:
-                    continue
-
-                counts[rule_name]["triggered"] += 1
-
-                if rule_name.endswith("_rank"):
-                    satisfied = vT < vU
-                else:
-                    satisfied = vT > vU
-
-                if satisfied:
-                    counts[rule_name]["satisfied"] += 1
+    layout = pair_layout(game.players)
+    tally = RuleTally(layout, synergy_rules, counts)
+
+    # Undefined ranks are NaN, so every comparison involving them is False and
+    # the pair keeps level 0 (undefined).
+    singleton_rank = layout.singleton_values(ranks)
+    level_arr = _synergy_levels(
+        singleton_rank[layout.pair_lo],
+        singleton_rank[layout.pair_hi],
+        layout.pair_values(ranks),
+    )
+
+    triggered = np.zeros(len(tally), dtype=np.int64)
+    satisfied = np.zeros(len(tally), dtype=np.int64)
+    for r, values in enumerate(tally.scores):
+        usable = (level_arr > 0) & ~np.isnan(values)
+        triggered[r], satisfied[r] = _count_level_pairs(
+            level_arr[usable], values[usable], bool(tally.is_rank[r])
+        )
+    tally.record(triggered, satisfied)
+
+
+def _synergy_levels(rA: np.ndarray, rB: np.ndarray, rP: np.ndarray) -> np.ndarray:
+    """Synergy level in {1,...,6} of each pair {A, B} (0 where undefined).
+
+    ``rA``/``rB`` are the singleton ranks of the members and ``rP`` the rank
+    of the pair. The first matching condition wins, in the same order as the
+    scalar definition.
+    """
+    level_arr = np.zeros(len(rP), dtype=np.int8)
+
+    def _assign(mask: np.ndarray, level: int) -> None:
+        level_arr[mask & (level_arr == 0)] = level
+
+    _assign((rP == rA) & (rA == rB), 3)
+    for c1, c2 in ((rA, rB), (rB, rA)):
+        _assign((rP < c1) & (c1 <= c2), 1)
+        _assign((rP == c1) & (c1 < c2), 2)
+        _assign((c1 < rP) & (rP < c2), 4)
+        _assign((c1 < rP) & (rP == c2), 5)
+        _assign((c1 <= c2) & (c2 < rP), 6)
+    return level_arr
+
+
+def _count_level_pairs(
+    levels: np.ndarray,
+    values: np.ndarray,
+    is_rank: bool,
+) -> tuple[int, int]:
+    """Count (T, U) pairs with levels[T] < levels[U] and how many agree.
+
+    Pairs are bucketed by level and processed from the highest level down,
+    keeping the sorted scores of all higher-level pairs so each bucket is
+    compared with a single ``searchsorted`` instead of an N x N mask. For rank
+    rules a pair agrees when vT < vU, otherwise when vT > vU.
+    """
+    n_triggered = 0
+    n_satisfied = 0
+    higher = np.empty(0, dtype=np.float64)
+    for level in np.unique(levels)[::-1]:
+        bucket = values[levels == level]
+        n_triggered += len(bucket) * len(higher)
+        if is_rank:
+            n_satisfied += int(
+                (len(higher) - np.searchsorted(higher, bucket, side="right")).sum()
+            )
+        else:
+            n_satisfied += int(np.searchsorted(higher, bucket, side="left").sum())
+        higher = np.sort(np.concatenate((higher, bucket)))
+    return n_triggered, n_satisfied
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
-from itertools import combinations
 from typing import Mapping
 
+import numpy as np
+
 from ...model.game import Coalition, Game
+from .pairs import pair_layout
+from .tally import RuleTally
 
 
 def update_swimmy_counts(
@@ -16,65 +19,95 @@ def update_swimmy_counts(
     if ranks is None:
         return
 
-    players = list(game.players)
-
-    two_sets: list[Coalition] = [
-        frozenset({i, j}) for i, j in combinations(players, 2)
-    ]
-
-    def cmp_coalitions(A: Coalition, B: Coalition) -> int | None:
-        rA = ranks.get(A)
-        rB = ranks.get(B)
-        if rA is None or rB is None:
-            return None
-        if rA < rB:
-            return 1
-        if rA > rB:
-            return -1
-        return 0
-
-    for rule_name in synergy_rules:
-        counts.setdefault(rule_name, {"triggered": 0, "satisfied": 0})
-
-    for S in two_sets:
-        s1, s2 = sorted(S)
-        for T in two_sets:
-            if T == S:
-                continue
-            t1, t2 = sorted(T)
-
-            antecedent_holds = False
-            for t1p, t2p in ((t1, t2), (t2, t1)):
-                c1 = cmp_coalitions(frozenset({s1}), frozenset({t1p}))
-                c2 = cmp_coalitions(frozenset({s2}), frozenset({t2p}))
-                cS = cmp_coalitions(S, T)
-                if c1 is None or c2 is None or cS is None:
-                    continue
-
-                ge1 = c1 in (0, 1)
-                ge2 = c2 in (0, 1)
-                S_pre_T = cS in (0, -1)
-                strict = (c1 == 1) or (c2 == 1) or (cS == -1)
-
-                if ge1 and ge2 and S_pre_T and strict:
-                    antecedent_holds = True
-                    break
-
-            if not antecedent_holds:
-                continue
-
-            for rule_name, scores in synergy_rules.items():
-                vS = scores.get(S)
-                vT = scores.get(T)
-                if vS is None or vT is None:
-                    continue
-
-                counts[rule_name]["triggered"] += 1
-
-                if rule_name.endswith("_rank"):
-                    satisfied = vT < vS
-                else:
-                    satisfied = vT > vS
-
-                if satisfied:
-                    counts[rule_name]["satisfied"] += 1
+    # Singleton/pair frozensets and member indices are shared by all games
+    # with the same roster.
+    layout = pair_layout(game.players)
+    tally = RuleTally(layout, synergy_rules, counts)
+
+    # Missing ranks and scores are NaN; the kernel treats them as undefined.
+    triggered, satisfied = _swimmy_kernel(
+        layout.singleton_values(ranks),
+        layout.pair_values(ranks),
+        layout.pair_lo,
+        layout.pair_hi,
+        tally.scores,
+        tally.is_rank,
+    )
+    tally.record(triggered, satisfied)
+
+
+def _swimmy_kernel(
+    singleton_rank: np.ndarray,
+    pair_rank: np.ndarray,
+    pair_s1: np.ndarray,
+    pair_s2: np.ndarray,
+    score_matrix: np.ndarray,
+    is_rank: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Count triggered/satisfied (S, T) pairs per rule.
+
+    Works on plain arrays only: ``pair_s1``/``pair_s2`` index each pair's
+    members into ``singleton_rank`` and ``score_matrix`` holds one row of
+    pair scores per rule. Missing ranks or scores are NaN, so every comparison
+    involving them is False.
+    """
+    triggered = np.zeros(len(score_matrix), dtype=np.int64)
+    satisfied = np.zeros(len(score_matrix), dtype=np.int64)
+
+    # A pair whose own rank or either member's rank is missing can never be
+    # part of a matching, so it is dropped before building the P x P masks.
+    rank_t1 = singleton_rank[pair_s1]
+    rank_t2 = singleton_rank[pair_s2]
+    ranked = np.flatnonzero(
+        ~(np.isnan(pair_rank) | np.isnan(rank_t1) | np.isnan(rank_t2))
+    )
+    if len(ranked) < 2:
+        return triggered, satisfied
+    if len(ranked) < len(pair_rank):
+        pair_rank = pair_rank[ranked]
+        rank_t1 = rank_t1[ranked]
+        rank_t2 = rank_t2[ranked]
+        score_matrix = score_matrix[:, ranked]
+
+    # Rows are indexed by S, columns by T; smaller rank is preferred.
+    rank_s1 = rank_t1[:, None]
+    rank_s2 = rank_t2[:, None]
+    S_pre_T = pair_rank[:, None] >= pair_rank[None, :]
+    S_strict = pair_rank[:, None] > pair_rank[None, :]
+
+    def _matching(
+        rank_t1p: np.ndarray, rank_t2p: np.ndarray, cols: slice | np.ndarray
+    ) -> np.ndarray:
+        ge1 = rank_s1 <= rank_t1p
+        ge2 = rank_s2 <= rank_t2p
+        strict = (rank_s1 < rank_t1p) | (rank_s2 < rank_t2p) | S_strict[:, cols]
+        return ge1 & ge2 & S_pre_T[:, cols] & strict
+
+    antecedent = _matching(rank_t1[None, :], rank_t2[None, :], slice(None))
+    # Swapping T's members only gives a different matching where their
+    # singleton ranks differ; tied columns would repeat the first test.
+    swap = np.flatnonzero(rank_t1 != rank_t2)
+    antecedent[:, swap] |= _matching(rank_t2[None, swap], rank_t1[None, swap], swap)
+    # No S == T exclusion is needed: on the diagonal both matchings force tied
+    # singleton ranks and S ~ T, so ``strict`` never holds there.
+
+    if not antecedent.any():
+        return triggered, satisfied
+
+    for r, values in enumerate(score_matrix):
+        # Only pairs scored by this rule can be triggered, so the comparison
+        # runs on the antecedent restricted to those rows and columns.
+        defined = np.flatnonzero(~np.isnan(values))
+        if len(defined) < 2:
+            continue
+        hits = antecedent[np.ix_(defined, defined)]
+
+        vS = values[defined][:, None]
+        vT = values[defined][None, :]
+        if is_rank[r]:
+            satisfied[r] = np.count_nonzero(hits & (vT < vS))
+        else:
+            satisfied[r] = np.count_nonzero(hits & (vT > vS))
+        triggered[r] = np.count_nonzero(hits)
+
+    return triggered, satisfied
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+from typing import Mapping
+
+import numpy as np
+
+from ...model.game import Coalition
+from .pairs import PairLayout
+
+
+class RuleTally:
+    """Per-rule bookkeeping shared by the Swimmy and SADA counters.
+
+    Resolves, once per call, whether each rule is rank-oriented (``*_rank``:
+    smaller is better), its pair scores as a ``(n_rules, n_pairs)`` array with
+    NaN for missing scores, and the ``counts`` entry it accumulates into.
+    """
+
+    def __init__(
+        self,
+        layout: PairLayout,
+        synergy_rules: Mapping[str, Mapping[Coalition, float]],
+        counts: dict[str, dict[str, int]],
+    ) -> None:
+        names = list(synergy_rules)
+        self.is_rank = np.array([name.endswith("_rank") for name in names], dtype=bool)
+        self.scores = np.array(
+            [layout.pair_values(synergy_rules[name]) for name in names],
+            dtype=np.float64,
+        ).reshape(len(names), len(layout.two_sets))
+        self._entries = [
+            counts.setdefault(name, {"triggered": 0, "satisfied": 0})
+            for name in names
+        ]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def record(self, triggered: np.ndarray, satisfied: np.ndarray) -> None:
+        """Add per-rule totals to the ``counts`` entries."""
+        for entry, n_triggered, n_satisfied in zip(
+            self._entries, triggered, satisfied, strict=True
+        ):
+            entry["triggered"] += int(n_triggered)
+            entry["satisfied"] += int(n_satisfied)
@@ -6,4 +6,9 @@ import pandas as pd
 
 
 def print_summary(df: pd.DataFrame, file: TextIO) -> None:
-    df.to_markdown(file, index=False)
+    """Write ``df`` as a Markdown table, one row at a time."""
+    columns = [str(c) for c in df.columns]
+    file.write("| " + " | ".join(columns) + " |\n")
+    file.write("|" + "|".join("---" for _ in columns) + "|\n")
+    for row in df.itertuples(index=False, name=None):
+        file.write("| " + " | ".join(str(x) for x in row) + " |\n")
@@ -1,43 +1,411 @@
 from __future__ import annotations
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from itertools import chain, repeat
 from pathlib import Path
-from typing import Any, Mapping
+from typing import Any, Iterable, Mapping, Sequence, TypeVar
 
+import numpy as np
 import pandas as pd
 from .axioms import update_sada_counts, update_swimmy_counts
 from ..config_loader import load_config
 from ..indices.banzhaf import compute_banzhaf
 from ..indices.ordinal import (
-    GroupLexCelRelation,
     LexCelRelation,
     compute_borda_interaction,
-    compute_group_lex_cel,
+    compute_group_lex_cel_theta,
     compute_group_ordinal_banzhaf_scores,
     compute_lex_cel,
     compute_ordinal_banzhaf_scores,
 )
-from ..indices.interactions import (
-    compute_banzhaf_interaction,
-    compute_shapley_interaction,
-)
+from ..indices.interactions import compute_interactions
 from ..indices.shapley import compute_shapley_exact, compute_shapley_mc
 from ..indices.synergy import compute_synergy
 from ..io.readers import read_game_table
 from ..io.validators import validate_game_table
 from ..io.writers import write_table
+from ..model.game import Coalition, Game
 from ..model.game_types import GameType
 from ..model.transforms import add_rank_from_value, build_games_from_table
 from ..utils.logging_utils import get_logger
-from .visualization import (
-    plot_coalitions,
-    plot_coalition_values,
-    plot_individuals,
-    plot_interaction_heatmap,
-    plot_rank_heatmap,
-)
 
 logger = get_logger(__name__)
 
+K = TypeVar("K")
+
+
+def _rank_values(values: Mapping[int, float]) -> dict[int, int]:
+    """Dense ranking of values: the largest value gets rank 1."""
+    if not values:
+        return {}
+    arr = np.fromiter(values.values(), dtype=np.float64, count=len(values))
+    unique_vals, inverse = np.unique(arr, return_inverse=True)
+    return dict(zip(values, (len(unique_vals) - inverse).tolist(), strict=True))
+
+
+def _rank_vectors(vectors: Mapping[K, Sequence[int]]) -> dict[K, int]:
+    """Dense ranking of equal-length vectors: the lexicographically largest
+    vector gets rank 1."""
+    if not vectors:
+        return {}
+    arr = np.array(list(vectors.values()), dtype=np.int64)
+    unique_rows, inverse = np.unique(arr, axis=0, return_inverse=True)
+    ranks = len(unique_rows) - inverse.reshape(-1)
+    return dict(zip(vectors, ranks.tolist(), strict=True))
+
+
+class _IntStrCache(dict):
+    """``str(i)`` memo for the small integers in labels (ids, theta counts)."""
+
+    def __missing__(self, key: int) -> str:
+        text = self[key] = str(key)
+        return text
+
+
+_INT_STRS = _IntStrCache()
+
+
+def _join_ints(values: Iterable[int]) -> str:
+    return ",".join(map(_INT_STRS.__getitem__, values))
+
+
+def _coalition_to_str(c: frozenset[int]) -> str:
+    if not c:
+        return "{}"
+    return "{" + _join_ints(sorted(c)) + "}"
+
+
+def _coalition_sort_key(c: frozenset[int]) -> tuple[int, tuple[int, ...]]:
+    return len(c), tuple(sorted(c))
+
+
+@dataclass(frozen=True)
+class _GameSettings:
+    """Per-game computation switches, resolved once from the configuration."""
+
+    shap_exact: bool
+    mc_samples: int
+    banz_enabled: bool
+    banz_normalize: bool
+    syn_enabled: bool
+    ord_enabled: bool
+    lex_enabled: bool
+    interactions_enabled: bool
+    shapley_interactions_enabled: bool
+    banzhaf_interactions_enabled: bool
+    borda_interactions_enabled: bool
+    group_ordinal_interactions_enabled: bool
+    group_lexcel_interactions_enabled: bool
+    swimmy_enabled: bool
+    sada_enabled: bool
+    # Synergy comparison rules each axiom is evaluated on, in output order:
+    # the enabled interaction indices, narrowed by axioms.<name>.rules.
+    swimmy_rules: tuple[str, ...]
+    sada_rules: tuple[str, ...]
+
+    @classmethod
+    def from_config(
+        cls,
+        indices_cfg: Mapping[str, Any],
+        axioms_cfg: Mapping[str, Any],
+    ) -> "_GameSettings":
+        shap_cfg: Mapping[str, Any] = indices_cfg.get("shapley", {})
+        banz_cfg: Mapping[str, Any] = indices_cfg.get("banzhaf", {})
+        syn_cfg: Mapping[str, Any] = indices_cfg.get("synergy", {})
+        ord_cfg: Mapping[str, Any] = indices_cfg.get("ordinal", {})
+        lex_cfg: Mapping[str, Any] = indices_cfg.get("lex_cel", {})
+        interactions_cfg: Mapping[str, Any] = indices_cfg.get("interactions", {})
+        swimmy_cfg: Mapping[str, Any] = axioms_cfg.get("swimmy", {})
+        sada_cfg: Mapping[str, Any] = axioms_cfg.get("sada", {})
+
+        shap_exact = bool(shap_cfg.get("exact", True))
+
+        interaction_flags = {
+            "shapley_interaction": interactions_cfg.get("shapley", True),
+            "banzhaf_interaction": interactions_cfg.get("banzhaf", True),
+            "borda_interaction": interactions_cfg.get("borda", False),
+            "group_ordinal_banzhaf_score": interactions_cfg.get(
+                "group_ordinal_banzhaf",
+                False,
+            ),
+            "group_lexcel_rank": interactions_cfg.get("group_lex_cel", False),
+        }
+        available_rules = [
+            name
+            for name, enabled in interaction_flags.items()
+            if enabled and interactions_cfg.get("enabled", False)
+        ]
+
+        def _plan_rules(axiom_cfg: Mapping[str, Any]) -> tuple[str, ...]:
+            # optional list of rule names
+            selected = axiom_cfg.get("rules")
+            if not selected:
+                return tuple(available_rules)
+            wanted = frozenset(selected)
+            return tuple(name for name in available_rules if name in wanted)
+
+        return cls(
+            shap_exact=shap_exact,
+            mc_samples=(
+                0 if shap_exact else int(shap_cfg.get("monte_carlo_samples", 1000))
+            ),
+            banz_enabled=banz_cfg.get("enabled", True),
+            banz_normalize=banz_cfg.get("normalize", True),
+            syn_enabled=syn_cfg.get("enabled", True),
+            ord_enabled=ord_cfg.get("enabled", False),
+            lex_enabled=lex_cfg.get("enabled", False),
+            interactions_enabled=interactions_cfg.get("enabled", False),
+            shapley_interactions_enabled=interaction_flags["shapley_interaction"],
+            banzhaf_interactions_enabled=interaction_flags["banzhaf_interaction"],
+            borda_interactions_enabled=interaction_flags["borda_interaction"],
+            group_ordinal_interactions_enabled=interaction_flags[
+                "group_ordinal_banzhaf_score"
+            ],
+            group_lexcel_interactions_enabled=interaction_flags["group_lexcel_rank"],
+            swimmy_enabled=swimmy_cfg.get("enabled", False),
+            sada_enabled=sada_cfg.get("enabled", False),
+            swimmy_rules=_plan_rules(swimmy_cfg),
+            sada_rules=_plan_rules(sada_cfg),
+        )
+
+
+class _ColumnTable:
+    """Column-oriented row accumulator.
+
+    Rows are appended as blocks of equal-length columns; a column missing from
+    a block (or first seen in a later one) is padded with ``None`` so that the
+    table stays rectangular, mirroring ``pd.DataFrame(list_of_dicts)``.
+    """
+
+    def __init__(self) -> None:
+        self.columns: dict[str, list[Any]] = {}
+        self.n_rows = 0
+
+    def extend(self, block: Mapping[str, list[Any]]) -> None:
+        n = len(next(iter(block.values()), ()))
+        if n == 0:
+            return
+        for name, values in block.items():
+            column = self.columns.get(name)
+            if column is None:
+                column = self.columns[name] = [None] * self.n_rows
+            column.extend(values)
+        self.n_rows += n
+        for column in self.columns.values():
+            if len(column) < self.n_rows:
+                column.extend([None] * (self.n_rows - len(column)))
+
+    def to_frame(self) -> pd.DataFrame:
+        """Build the DataFrame and release the buffered column lists."""
+        frame = pd.DataFrame(self.columns)
+        self.columns = {}
+        self.n_rows = 0
+        return frame
+
+
+@dataclass
+class _GameResult:
+    """Column blocks and axiom counts produced by a single game."""
+
+    columns: dict[str, list[Any]] = field(default_factory=dict)
+    interaction_columns: dict[str, list[Any]] = field(default_factory=dict)
+    swimmy_counts: dict[str, dict[str, int]] = field(default_factory=dict)
+    sada_counts: dict[str, dict[str, int]] = field(default_factory=dict)
+
+
+def _merge_counts(
+    total: dict[str, dict[str, int]],
+    part: Mapping[str, Mapping[str, int]],
+) -> None:
+    for rule_name, data in part.items():
+        entry = total.setdefault(rule_name, {"triggered": 0, "satisfied": 0})
+        entry["triggered"] += data["triggered"]
+        entry["satisfied"] += data["satisfied"]
+
+
+def _process_game(game: Game, settings: _GameSettings) -> _GameResult:
+    """Compute all configured indices and axiom counts for one game.
+
+    Module-level (and only depending on picklable arguments) so that games can
+    be dispatched to worker processes.
+    """
+    result = _GameResult()
+
+    shapley: dict[int, float] = {}
+    if settings.shap_exact:
+        shapley = compute_shapley_exact(game)
+    else:
+        shapley = compute_shapley_mc(game, num_samples=settings.mc_samples)
+
+    banzhaf = {}
+    if settings.banz_enabled:
+        banzhaf = compute_banzhaf(game, normalize=settings.banz_normalize)
+
+    synergy = {}
+    if settings.syn_enabled:
+        synergy = compute_synergy(game)
+
+    # Player-level rankings based on cardinal indices (dense ranking).
+    shapley_rank: dict[int, int] | None = None
+    if shapley:
+        shapley_rank = _rank_values(shapley)
+
+    banzhaf_rank: dict[int, int] | None = None
+    if banzhaf:
+        banzhaf_rank = _rank_values(banzhaf)
+
+    lex_rel: LexCelRelation | None = None
+    lex_ranks: dict[int, int] | None = None
+    if settings.lex_enabled:
+        try:
+            lex_rel = compute_lex_cel(game)
+            # Rank (layer) from frequency vectors: higher is better.
+            lex_ranks = _rank_vectors(lex_rel.theta)
+        except ValueError as exc:
+            logger.warning("lex-cel requested but not applicable: %s", exc)
+
+    ordinal_scores: dict[int, int] | None = None
+    ordinal_rank: dict[int, int] | None = None
+    if settings.ord_enabled:
+        try:
+            ordinal_scores = compute_ordinal_banzhaf_scores(game)
+            if ordinal_scores:
+                # Reuse ranking helper; larger score is better.
+                ordinal_rank = _rank_values(ordinal_scores)
+        except ValueError as exc:
+            logger.warning("ordinal Banzhaf requested but not applicable: %s", exc)
+
+    players = game.players
+    columns = result.columns
+    columns["player"] = list(players)
+    columns["shapley"] = [shapley.get(pid) for pid in players]
+    columns["banzhaf"] = [banzhaf.get(pid) for pid in players]
+    if shapley_rank is not None:
+        columns["shapley_rank"] = [shapley_rank.get(pid) for pid in players]
+    if banzhaf_rank is not None:
+        columns["banzhaf_rank"] = [banzhaf_rank.get(pid) for pid in players]
+    if ordinal_scores is not None:
+        columns["ordinal_banzhaf_score"] = [
+            ordinal_scores.get(pid) for pid in players
+        ]
+    if ordinal_rank is not None:
+        columns["ordinal_banzhaf_rank"] = [ordinal_rank.get(pid) for pid in players]
+    if lex_rel is not None:
+        thetas = [lex_rel.theta.get(pid) for pid in players]
+        columns["lex_cel_theta"] = [
+            _join_ints(theta) if theta is not None else None
+            for theta in thetas
+        ]
+        if lex_ranks is not None:
+            columns["lex_cel_rank"] = [lex_ranks.get(pid) for pid in players]
+
+    logger.info(
+        "Processed game with %d players and %d coalitions",
+        len(game.players),
+        len(game.coalitions),
+    )
+
+    # Interaction scores stay empty unless enabled; the axiom counters below
+    # read them either way.
+    shap_int: dict[Coalition, float] = {}
+    banz_int: dict[Coalition, float] = {}
+    borda_int: dict[Coalition, int] = {}
+    group_ord: dict[Coalition, int] = {}
+    group_lex_rank: dict[Coalition, int] | None = None
+    group_lex_theta: Mapping[Coalition, Sequence[int]] | None = None
+
+    if settings.interactions_enabled:
+        # Shapley and Banzhaf interactions share one Möbius transform.
+        which = [
+            name
+            for name, enabled in (
+                ("shapley", settings.shapley_interactions_enabled),
+                ("banzhaf", settings.banzhaf_interactions_enabled),
+            )
+            if enabled
+        ]
+        if which:
+            cardinal = compute_interactions(game, which=which)
+            shap_int = cardinal.get("shapley", {})
+            banz_int = cardinal.get("banzhaf", {})
+        if settings.borda_interactions_enabled:
+            borda_int = compute_borda_interaction(game)
+        if settings.group_ordinal_interactions_enabled:
+            group_ord = compute_group_ordinal_banzhaf_scores(game)
+        if settings.group_lexcel_interactions_enabled:
+            try:
+                # Only Θ is written out, so the P/I relation is not built.
+                group_lex_theta = compute_group_lex_cel_theta(game)
+                group_lex_rank = _rank_vectors(group_lex_theta)
+            except ValueError as exc:
+                logger.warning("group lex-cel requested but not applicable: %s", exc)
+
+        # The enabled indices usually cover the same coalitions, in which
+        # case the first key view is used as is instead of building a union.
+        key_views = [
+            scores.keys()
+            for scores in (shap_int, banz_int, borda_int, group_ord, group_lex_theta)
+            if scores
+        ]
+        shared_keys = all(view == key_views[0] for view in key_views[1:])
+        if shared_keys:
+            coalitions = list(key_views[0]) if key_views else []
+        else:
+            coalitions = list(dict.fromkeys(chain.from_iterable(key_views)))
+
+        def _column(scores: Mapping[Coalition, Any] | None) -> list[Any]:
+            if not scores:
+                return [None] * len(coalitions)
+            if shared_keys:
+                # Every coalition is a key, so no None-returning probe.
+                return [scores[c] for c in coalitions]
+            return [scores.get(c) for c in coalitions]
+
+        theta_column = _column(group_lex_theta)
+        result.interaction_columns.update(
+            {
+                "_coalition": coalitions,
+                "size": [len(c) for c in coalitions],
+                "shapley_interaction": _column(shap_int),
+                "banzhaf_interaction": _column(banz_int),
+                "borda_interaction": _column(borda_int),
+                "group_ordinal_banzhaf_score": _column(group_ord),
+                "group_lexcel_theta": [
+                    _join_ints(theta) if theta is not None else None
+                    for theta in theta_column
+                ],
+                "group_lexcel_rank": _column(group_lex_rank),
+            }
+        )
+
+    if (settings.swimmy_enabled or settings.sada_enabled) and game.ranks is not None:
+        # 各シナジー比較ルールごとのスコア辞書を構築
+        # The rule names are planned once in _GameSettings; per game only the
+        # non-empty score dicts are picked up. The counters read scores into
+        # float64 arrays themselves, so the dicts are passed without a copy.
+        rule_scores: dict[str, Mapping[Coalition, float] | None] = {
+            "shapley_interaction": shap_int,
+            "banzhaf_interaction": banz_int,
+            "borda_interaction": borda_int,
+            "group_ordinal_banzhaf_score": group_ord,
+            "group_lexcel_rank": group_lex_rank,
+        }
+
+        def _rules(names: tuple[str, ...]) -> dict[str, Mapping[Coalition, float]]:
+            return {name: scores for name in names if (scores := rule_scores[name])}
+
+        if settings.swimmy_enabled:
+            update_swimmy_counts(
+                game, _rules(settings.swimmy_rules), result.swimmy_counts
+            )
+        if settings.sada_enabled:
+            update_sada_counts(game, _rules(settings.sada_rules), result.sada_counts)
+
+    return result
+
 
 def run_from_config(config_path: Path) -> None:
     cfg = load_config(config_path)
@@ -45,37 +413,44 @@ def run_from_config(config_path: Path) -> None:
     indices_cfg: Mapping[str, Any] = cfg.get("indices", {})
     output_cfg: Mapping[str, Any] = cfg.get("output", {})
     axioms_cfg: Mapping[str, Any] = cfg.get("axioms", {})
-    swimmy_cfg: Mapping[str, Any] = axioms_cfg.get("swimmy", {})
-    swimmy_enabled = swimmy_cfg.get("enabled", False)
-    swimmy_rule_filter = swimmy_cfg.get("rules")  # optional list of rule names
-    sada_cfg: Mapping[str, Any] = axioms_cfg.get("sada", {})
-    sada_enabled = sada_cfg.get("enabled", False)
-    sada_rule_filter = sada_cfg.get("rules")  # optional list of rule names
 
+    scenario_col = input_cfg.get("scenario_column", "scenario_id")
+    game_col = input_cfg.get("game_column", "game_id")
+    value_col = input_cfg.get("value_column", "value")
+    rank_col = input_cfg.get("rank_column", "rank")
+
+    # Only the columns used below are read; validate_game_table checks the
+    # default scenario/game names, so those are kept as well.
     df = read_game_table(
         input_cfg["path"],
         fmt=input_cfg.get("format"),
         coalition_column=input_cfg.get("coalition_column", "coalition"),
+        columns=[scenario_col, game_col, "scenario_id", "game_id", value_col, rank_col],
     )
 
     # Fill missing scenario/game columns with defaults if absent
-    scenario_col = input_cfg.get("scenario_column", "scenario_id")
-    game_col = input_cfg.get("game_column", "game_id")
     if scenario_col not in df.columns:
         df[scenario_col] = 0
     if game_col not in df.columns:
         df[game_col] = 0
 
-    # Optionally derive coalition ranks from values.
+    # Optionally derive coalition ranks from values. A rank column supplied
+    # by the input is kept as is when it covers every row, unless
+    # ranking.force asks for it to be recomputed.
     ranking_cfg: Mapping[str, Any] = input_cfg.get("ranking", {})  # type: ignore[assignment]
     mode = str(ranking_cfg.get("mode", "dense")).lower()
-    if mode != "none":
+    keep_input_rank = (
+        not ranking_cfg.get("force", False)
+        and rank_col in df.columns
+        and not df[rank_col].isna().any()
+    )
+    if mode != "none" and not keep_input_rank:
         df = add_rank_from_value(
             df,
             scenario_column=scenario_col,
             game_column=game_col,
-            value_column=input_cfg.get("value_column", "value"),
-            rank_column=input_cfg.get("rank_column", "rank"),
+            value_column=value_col,
+            rank_column=rank_col,
             method=mode,
             bin_width=ranking_cfg.get("bin_width"),
             descending=ranking_cfg.get("descending", True),
@@ -90,270 +465,81 @@ def run_from_config(config_path: Path) -> None:
         game_type=game_type,
         scenario_column=scenario_col,
         game_column=game_col,
-        value_column=input_cfg.get("value_column", "value"),
-        rank_column=input_cfg.get("rank_column", "rank"),
+        value_column=value_col,
+        rank_column=rank_col,
         players_override=input_cfg.get("players"),
     )
 
-    rows: list[dict[str, Any]] = []
-    interaction_rows: list[dict[str, Any]] = []
+    settings = _GameSettings.from_config(indices_cfg, axioms_cfg)
+    parallel_cfg: Mapping[str, Any] = cfg.get("parallel", {})
+    workers = int(parallel_cfg.get("workers", 1))
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+
+    rows = _ColumnTable()
+    interaction_rows = _ColumnTable()
     swimmy_counts: dict[str, dict[str, int]] = {}
     sada_counts: dict[str, dict[str, int]] = {}
 
-    interactions_cfg: Mapping[str, Any] = indices_cfg.get("interactions", {})
-    interactions_enabled = interactions_cfg.get("enabled", False)
-    shapley_interactions_enabled = interactions_cfg.get("shapley", True)
-    banzhaf_interactions_enabled = interactions_cfg.get("banzhaf", True)
-    borda_interactions_enabled = interactions_cfg.get("borda", False)
-    group_ordinal_interactions_enabled = interactions_cfg.get(
-        "group_ordinal_banzhaf",
-        False,
-    )
-    group_lexcel_interactions_enabled = interactions_cfg.get(
-        "group_lex_cel",
-        False,
-    )
-    for game in games:
-        shap_cfg = indices_cfg.get("shapley", {})
-        banz_cfg = indices_cfg.get("banzhaf", {})
-        syn_cfg = indices_cfg.get("synergy", {})
-        ord_cfg = indices_cfg.get("ordinal", {})
-        lex_cfg = indices_cfg.get("lex_cel", {})
-
-        shapley: dict[int, float] = {}
-        if shap_cfg.get("exact", True):
-            shapley = compute_shapley_exact(game)
-        else:
-            mc_samples = int(shap_cfg.get("monte_carlo_samples", 1000))
-            shapley = compute_shapley_mc(game, num_samples=mc_samples)
-
-        banzhaf = {}
-        if banz_cfg.get("enabled", True):
-            banzhaf = compute_banzhaf(game, normalize=banz_cfg.get("normalize", True))
-
-        synergy = {}
-        if syn_cfg.get("enabled", True):
-            synergy = compute_synergy(game)
-
-        # Player-level rankings based on cardinal indices (dense ranking).
-        def _rank_values(values: dict[int, float]) -> dict[int, int]:
-            if not values:
-                return {}
-            unique_vals = sorted(set(values.values()), reverse=True)
-            val_to_rank = {v: idx + 1 for idx, v in enumerate(unique_vals)}
-            return {pid: val_to_rank[v] for pid, v in values.items()}
-
-        shapley_rank: dict[int, int] | None = None
-        if shapley:
-            shapley_rank = _rank_values(shapley)
-
-        banzhaf_rank: dict[int, int] | None = None
-        if banzhaf:
-            banzhaf_rank = _rank_values(banzhaf)
-
-        lex_rel: LexCelRelation | None = None
-        lex_ranks: dict[int, int] | None = None
-        if lex_cfg.get("enabled", False):
-            try:
-                lex_rel = compute_lex_cel(game)
-                # Build rank (layer) from frequency vectors: higher is better.
-                unique_vectors = sorted(
-                    {tuple(v) for v in lex_rel.theta.values()},
-                    reverse=True,
-                )
-                vec_to_rank = {
-                    vec: idx + 1 for idx, vec in enumerate(unique_vectors)
-                }
-                lex_ranks = {
-                    pid: vec_to_rank[tuple(lex_rel.theta[pid])]
-                    for pid in game.players
-                    if pid in lex_rel.theta
-                }
-            except ValueError as exc:
-                logger.warning("lex-cel requested but not applicable: %s", exc)
-
-        ordinal_scores: dict[int, int] | None = None
-        ordinal_rank: dict[int, int] | None = None
-        if ord_cfg.get("enabled", False):
-            try:
-                ordinal_scores = compute_ordinal_banzhaf_scores(game)
-                if ordinal_scores:
-                    # Reuse ranking helper; larger score is better.
-                    ordinal_rank = _rank_values(
-                        {pid: float(s) for pid, s in ordinal_scores.items()}
-                    )
-            except ValueError as exc:
-                logger.warning("ordinal Banzhaf requested but not applicable: %s", exc)
-
-        for pid in game.players:
-            row: dict[str, Any] = {
-                "player": pid,
-                "shapley": shapley.get(pid),
-                "banzhaf": banzhaf.get(pid),
-            }
-            if shapley_rank is not None:
-                row["shapley_rank"] = shapley_rank.get(pid)
-            if banzhaf_rank is not None:
-                row["banzhaf_rank"] = banzhaf_rank.get(pid)
-            if ordinal_scores is not None:
-                row["ordinal_banzhaf_score"] = ordinal_scores.get(pid)
-            if ordinal_rank is not None:
-                row["ordinal_banzhaf_rank"] = ordinal_rank.get(pid)
-            if lex_rel is not None:
-                theta = lex_rel.theta.get(pid)
-                row["lex_cel_theta"] = (
-                    ",".join(str(x) for x in theta) if theta is not None else None
-                )
-                if lex_ranks is not None:
-                    row["lex_cel_rank"] = lex_ranks.get(pid)
-            rows.append(row)
-
-        logger.info(
-            "Processed game with %d players and %d coalitions",
-            len(game.players),
-            len(game.coalitions),
-        )
-
-        if interactions_enabled:
-            shap_int = (
-                compute_shapley_interaction(game)
-                if shapley_interactions_enabled
-                else {}
-            )
-            banz_int = (
-                compute_banzhaf_interaction(game)
-                if banzhaf_interactions_enabled
-                else {}
-            )
-            borda_int = (
-                compute_borda_interaction(game)
-                if borda_interactions_enabled
-                else {}
-            )
-            group_ord = (
-                compute_group_ordinal_banzhaf_scores(game)
-                if group_ordinal_interactions_enabled
-                else {}
+    with ExitStack() as stack:
+        if workers > 1 and len(games) > 1:
+            # Games are independent, so they are processed in worker
+            # processes; map() keeps results in game order.
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            chunksize = max(1, len(games) // (workers * 4))
+            results: Iterable[_GameResult] = executor.map(
+                _process_game, games, repeat(settings), chunksize=chunksize
             )
-            group_lex_rel: GroupLexCelRelation | None = None
-            group_lex_rank: dict[Coalition, int] | None = None
-            group_lex_theta: dict[Coalition, Sequence[int]] | None = None
-            if group_lexcel_interactions_enabled:
-                try:
-                    group_lex_rel = compute_group_lex_cel(game)
-                    group_lex_theta = {
-                        c: tuple(v) for c, v in group_lex_rel.theta.items()
-                    }
-                    unique_vecs = sorted(
-                        set(group_lex_theta.values()),
-                        reverse=True,
-                    )
-                    vec_to_rank = {
-                        vec: idx + 1 for idx, vec in enumerate(unique_vecs)
-                    }
-                    group_lex_rank = {
-                        c: vec_to_rank[group_lex_theta[c]] for c in group_lex_theta
-                    }
-                except ValueError as exc:
-                    logger.warning("group lex-cel requested but not applicable: %s", exc)
-
-            all_coalitions = (
-                set(shap_int.keys())
-                | set(banz_int.keys())
-                | set(borda_int.keys())
-                | set(group_ord.keys())
-                | (set(group_lex_theta.keys()) if group_lex_theta else set())
-            )
-
-            def _coalition_to_str(c: frozenset[int]) -> str:
-                if not c:
-                    return "{}"
-                parts = ",".join(str(x) for x in sorted(c))
-                return "{" + parts + "}"
-
-            for coalition in all_coalitions:
-                theta_str = None
-                rank_val = None
-                if group_lex_theta is not None and coalition in group_lex_theta:
-                    theta_str = ",".join(str(x) for x in group_lex_theta[coalition])
-                if group_lex_rank is not None:
-                    rank_val = group_lex_rank.get(coalition)
-
-                interaction_rows.append(
-                    {
-                        "coalition": _coalition_to_str(coalition),
-                        "size": len(coalition),
-                        "shapley_interaction": shap_int.get(coalition),
-                        "banzhaf_interaction": banz_int.get(coalition),
-                        "borda_interaction": borda_int.get(coalition),
-                        "group_ordinal_banzhaf_score": group_ord.get(coalition),
-                        "group_lexcel_theta": theta_str,
-                        "group_lexcel_rank": rank_val,
-                    }
-                )
+        else:
+            results = (_process_game(game, settings) for game in games)
 
-        if (swimmy_enabled or sada_enabled) and game.ranks is not None:
-            # 各シナジー比較ルールごとのスコア辞書を構築
-            all_rules: dict[str, dict[Coalition, float]] = {}
-            if shap_int:
-                all_rules["shapley_interaction"] = {
-                    c: float(v) for c, v in shap_int.items()
-                }
-            if banz_int:
-                all_rules["banzhaf_interaction"] = {
-                    c: float(v) for c, v in banz_int.items()
-                }
-            if borda_int:
-                all_rules["borda_interaction"] = {
-                    c: float(v) for c, v in borda_int.items()
-                }
-            if group_ord:
-                all_rules["group_ordinal_banzhaf_score"] = {
-                    c: float(v) for c, v in group_ord.items()
-                }
-            if group_lex_rank:
-                all_rules["group_lexcel_rank"] = {
-                    c: float(v) for c, v in group_lex_rank.items()
-                }
+        # Merge results as they arrive so that each game's blocks can be
+        # released right away instead of all being held until the end.
+        for result in results:
+            rows.extend(result.columns)
+            interaction_rows.extend(result.interaction_columns)
+            _merge_counts(swimmy_counts, result.swimmy_counts)
+            _merge_counts(sada_counts, result.sada_counts)
 
-            if swimmy_enabled:
-                swimmy_rules = all_rules
-                if swimmy_rule_filter:
-                    swimmy_rules = {
-                        name: scores
-                        for name, scores in all_rules.items()
-                        if name in swimmy_rule_filter
-                    }
-                update_swimmy_counts(game, swimmy_rules, swimmy_counts)
-
-            if sada_enabled:
-                sada_rules = all_rules
-                if sada_rule_filter:
-                    sada_rules = {
-                        name: scores
-                        for name, scores in all_rules.items()
-                        if name in sada_rule_filter
-                    }
-                update_sada_counts(game, sada_rules, sada_counts)
-
-    result_df = pd.DataFrame(rows)
-    interactions_df = pd.DataFrame(interaction_rows)
+    result_df = rows.to_frame()
+    interactions_df = interaction_rows.to_frame()
 
     # coalition の並び順は coalition の構造に基づく固定順序に統一する
     if not interactions_df.empty:
-        if "size" in interactions_df.columns:
-            interactions_df = interactions_df.sort_values(
-                ["size", "coalition"],
-                kind="mergesort",
-            )
-        else:
-            interactions_df = interactions_df.sort_values(
-                ["coalition"],
-                kind="mergesort",
-            )
+        # Order by (size, members) with numeric member comparison ({1,2} before
+        # {1,10}). Distinct coalitions are ranked once; the rank doubles as the
+        # code of a categorical coalition column whose categories (the labels,
+        # formatted once per coalition) are already in sorted order.
+        row_coalitions = interactions_df["_coalition"].tolist()
+        ordered = sorted(dict.fromkeys(row_coalitions), key=_coalition_sort_key)
+        position = {c: pos for pos, c in enumerate(ordered)}
+        codes = np.fromiter(
+            map(position.__getitem__, row_coalitions),
+            dtype=np.intp,
+            count=len(row_coalitions),
+        )
+        interactions_df.insert(
+            1,
+            "coalition",
+            pd.Categorical.from_codes(
+                codes,
+                categories=[_coalition_to_str(c) for c in ordered],
+                ordered=True,
+            ),
+        )
+        interactions_df = interactions_df.iloc[np.argsort(codes, kind="stable")]
+
+        # The frozenset column is internal bookkeeping, not an output column.
+        interactions_df = interactions_df.drop(columns="_coalition")
 
     fmt = str(output_cfg.get("format", "csv"))
     raw_out_path = output_cfg.get("path")
+    # Parquet writer options; write_table's defaults apply when unset.
+    write_opts: dict[str, Any] = {
+        key: output_cfg[key]
+        for key in ("compression", "row_group_size")
+        if key in output_cfg
+    }
 
     src_path = Path(input_cfg["path"])
     if raw_out_path is None:
@@ -381,28 +567,47 @@ def run_from_config(config_path: Path) -> None:
     if result_df.empty:
         logger.warning("No player-level results produced.")
     else:
-        write_table(result_df, metrics_path, fmt=fmt)
+        write_table(result_df, metrics_path, fmt=fmt, **write_opts)
         logger.info("Wrote metrics table to %s", metrics_path)
 
     if not interactions_df.empty:
         # coalition カラムは既に "{1,2}" 形式の文字列なので、そのまま保存
-        write_table(interactions_df, interactions_path, fmt=fmt)
+        write_table(interactions_df, interactions_path, fmt=fmt, **write_opts)
         logger.info("Wrote interaction table to %s", interactions_path)
 
     # Visualization (enabled by default)
     viz_cfg: Mapping[str, Any] = cfg.get("visualization", {})
     viz_enabled = viz_cfg.get("enabled", True)
     if viz_enabled:
+        # Imported here so that runs without plots never load matplotlib.
+        from .visualization import (
+            plot_coalition_values,
+            plot_coalitions,
+            plot_individuals,
+            plot_interaction_heatmap,
+            plot_rank_heatmap,
+        )
+
         try:
             if not result_df.empty:
                 plot_individuals(result_df, viz_dir)
                 plot_rank_heatmap(result_df, viz_dir)
+            # Per-coalition bar charts grow with the number of rows (one bar
+            # each); the correlation heatmaps only with the number of indices.
+            max_bars = int(viz_cfg.get("max_coalition_bars", 4096))
+            coalition_bars = len(interactions_df) <= max_bars
+            if not coalition_bars:
+                logger.info(
+                    "Skipping coalition bar charts: %d rows > max_coalition_bars=%d",
+                    len(interactions_df),
+                    max_bars,
+                )
             if not interactions_df.empty:
-                plot_coalitions(interactions_df, viz_dir)
+                if coalition_bars:
+                    plot_coalitions(interactions_df, viz_dir)
                 plot_interaction_heatmap(interactions_df, viz_dir)
             # 元のゲームテーブル値に基づく coalition スコアの棒グラフ
-            value_col = input_cfg.get("value_column", "value")
-            if value_col in df.columns:
+            if coalition_bars and value_col in df.columns:
                 # coalition の並び順は interactions_df の coalition 列に合わせる
                 order: list[str] | None = None
                 if not interactions_df.empty and "coalition" in interactions_df.columns:
@@ -1,10 +1,35 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
 
 def summarize_indices(df: pd.DataFrame) -> pd.DataFrame:
+    """Mean of every numeric column per player (NaN entries are skipped).
+
+    Equivalent to ``df.groupby("player").mean(numeric_only=True)``, computed
+    with ``np.bincount`` over the dense player codes instead of a groupby.
+    """
     if "player" not in df.columns:
         msg = "Input must contain 'player' column."
         raise ValueError(msg)
-    return df.groupby("player").mean(numeric_only=True).reset_index()
+
+    players = df["player"]
+    valid = players.notna().to_numpy()
+    keys, inverse = np.unique(players.to_numpy()[valid], return_inverse=True)
+    inverse = inverse.reshape(-1)
+
+    means: dict[str, np.ndarray] = {"player": keys}
+    numeric = df.select_dtypes(include=["number", "bool"]).columns
+    for name in numeric:
+        if name == "player":
+            continue
+        values = df[name].to_numpy(dtype=np.float64, na_value=np.nan)[valid]
+        present = ~np.isnan(values)
+        sums = np.bincount(
+            inverse[present], weights=values[present], minlength=len(keys)
+        )
+        counts = np.bincount(inverse[present], minlength=len(keys))
+        with np.errstate(invalid="ignore", divide="ignore"):
+            means[name] = sums / counts
+    return pd.DataFrame(means)
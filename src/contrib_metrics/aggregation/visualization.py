@@ -1,10 +1,116 @@
 from __future__ import annotations
 
+from functools import lru_cache
+from io import BytesIO
 from pathlib import Path
-from typing import Iterable, List
+from typing import Iterable, List, Sequence
 
-import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
+from matplotlib.axes import Axes
+from matplotlib.container import BarContainer
+from matplotlib.figure import Figure
+from matplotlib.ticker import AutoLocator, ScalarFormatter
+
+# 図は pyplot を介さず Figure から直接作る（ファイル出力のみなので GUI
+# バックエンドやグローバルな pyplot の状態には触れない）
+
+# PNG の zlib 圧縮はデフォルト (6) だと保存時間の大半を占めるため、軽めの設定にする
+_PNG_PIL_KWARGS = {"compress_level": 3, "optimize": False}
+
+
+def _savefig(path: Path, fig: Figure) -> None:
+    """Save ``fig`` as PNG in a single write."""
+    buf = BytesIO()
+    fig.savefig(buf, format="png", pil_kwargs=_PNG_PIL_KWARGS)
+    Path(path).write_bytes(buf.getvalue())
+
+
+class _BarFigure:
+    """A single figure/axes reused for every bar chart over the same x axis.
+
+    The bars are created on the first ``plot`` call; later calls only update
+    their heights, labels and y axis before saving, so the figure, axes and
+    tick labels are built once per group of plots instead of once per file.
+    """
+
+    def __init__(
+        self,
+        figsize: tuple[float, float],
+        x: Sequence[object],
+        xticklabels: Sequence[str] | None = None,
+        xlabel: str | None = None,
+    ) -> None:
+        self._figsize = figsize
+        self._x = x
+        self._xticklabels = xticklabels
+        self._xlabel = xlabel
+        self._fig: Figure | None = None
+        self._ax: Axes | None = None
+        self._bars: BarContainer | None = None
+
+    def plot(
+        self, values: Iterable[float], ylabel: str, title: str, path: Path
+    ) -> None:
+        heights = np.asarray(values, dtype=np.float64)
+        ax = self._draw(heights)
+        ax.yaxis.set_major_locator(AutoLocator())
+        ax.yaxis.set_major_formatter(ScalarFormatter())
+        ax.set_autoscaley_on(True)
+        ax.autoscale_view(scalex=False)
+        self._finish(ylabel, title, path)
+
+    def plot_rank(
+        self, ranks: Iterable[float], ylabel: str, title: str, path: Path
+    ) -> None:
+        ranks = np.asarray(ranks, dtype=np.float64)
+        # rank は「小さいほど良い」ので、そのまま棒の高さに使うと
+        # 下に良いプレイヤーが来てしまう。そこで、
+        #   plot_val = max_rank + 1 - rank
+        # として「良いほど棒が高い」ように変換し、
+        # 軸の目盛りは元の rank を逆順で表示する。
+        max_rank = int(np.nanmax(ranks))
+        ax = self._draw(max_rank + 1 - ranks)
+        ax.set_ylim(0, max_rank + 1)
+        tick_positions, tick_labels = _rank_ticks(max_rank)
+        ax.set_yticks(tick_positions, tick_labels)
+        self._finish(ylabel, title, path)
+
+    def close(self) -> None:
+        self._fig = self._ax = self._bars = None
+
+    def _draw(self, heights: np.ndarray) -> Axes:
+        if self._bars is None:
+            self._fig = Figure(figsize=self._figsize)
+            self._ax = self._fig.subplots()
+            self._bars = self._ax.bar(self._x, heights)
+            if self._xticklabels is not None:
+                self._ax.set_xticks(self._x, self._xticklabels, rotation=90)
+            if self._xlabel is not None:
+                self._ax.set_xlabel(self._xlabel)
+        else:
+            for patch, height in zip(self._bars, heights, strict=True):
+                patch.set_height(height)
+            # NaN の棒は軸範囲から外れるので、新規作成時と同じく x 方向も再計算し、
+            # 目盛りを明示している場合はその範囲まで広げる
+            self._ax.relim()
+            self._ax.autoscale_view()
+            if self._xticklabels is not None:
+                self._ax.xaxis.set_view_interval(min(self._x), max(self._x))
+        return self._ax
+
+    def _finish(self, ylabel: str, title: str, path: Path) -> None:
+        self._ax.set_ylabel(ylabel)
+        self._ax.set_title(title)
+        self._fig.tight_layout()
+        _savefig(path, self._fig)
+
+
+@lru_cache(maxsize=32)
+def _rank_ticks(max_rank: int) -> tuple[tuple[int, ...], tuple[str, ...]]:
+    """Y tick positions/labels putting rank 1 at the top and max_rank at the bottom."""
+    ranks = range(1, max_rank + 1)
+    return tuple(max_rank + 1 - r for r in ranks), tuple(map(str, ranks))
 
 
 def plot_individuals(df: pd.DataFrame, out_dir: Path, title_prefix: str = "") -> None:
@@ -12,20 +118,12 @@ def plot_individuals(df: pd.DataFrame, out_dir: Path, title_prefix: str = "") ->
     if "player" not in df.columns:
         return
 
-    players = df["player"].astype(str)
+    bars = _BarFigure((8, 4), list(df["player"].astype(str)), xlabel="player")
 
     def _bar_plot(column: str, filename: str, ylabel: str) -> None:
         if column not in df.columns:
             return
-        values = df[column]
-        plt.figure(figsize=(8, 4))
-        plt.bar(players, values)
-        plt.xlabel("player")
-        plt.ylabel(ylabel)
-        plt.title(f"{title_prefix}{column}")
-        plt.tight_layout()
-        plt.savefig(out_dir / filename)
-        plt.close()
+        bars.plot(df[column], ylabel, f"{title_prefix}{column}", out_dir / filename)
 
     def _bar_plot_rank(column: str, filename: str, ylabel: str) -> None:
         if column not in df.columns:
@@ -33,43 +131,26 @@ def plot_individuals(df: pd.DataFrame, out_dir: Path, title_prefix: str = "") ->
         values = df[column]
         if values.empty:
             return
-        # rank は「小さいほど良い」ので、そのまま棒の高さに使うと
-        # 下に良いプレイヤーが来てしまう。そこで、
-        #   plot_val = max_rank + 1 - rank
-        # として「良いほど棒が高い」ように変換し、
-        # 軸の目盛りは元の rank を逆順で表示する。
-        max_rank = int(values.max())
-        plot_vals = max_rank + 1 - values
-        plt.figure(figsize=(8, 4))
-        plt.bar(players, plot_vals)
-        plt.xlabel("player")
-        plt.ylabel(ylabel)
-        plt.title(f"{title_prefix}{column}")
-        ax = plt.gca()
-        ax.set_ylim(0, max_rank + 1)
-        # 上に rank=1、下に rank=max_rank が来るように目盛りを配置
-        tick_positions = [max_rank + 1 - r for r in range(1, max_rank + 1)]
-        ax.set_yticks(tick_positions)
-        ax.set_yticklabels([str(r) for r in range(1, max_rank + 1)])
-        plt.tight_layout()
-        plt.savefig(out_dir / filename)
-        plt.close()
-
-    # 値ベースの指標
-    _bar_plot("shapley", "individuals_shapley.png", "Shapley value")
-    _bar_plot("banzhaf", "individuals_banzhaf.png", "Banzhaf value")
-
-    # ランクベースの指標（値を持たない純粋な ordinal 指標のみ）
-    _bar_plot_rank(
-        "ordinal_banzhaf_rank",
-        "individuals_ordinal_banzhaf_rank.png",
-        "Ordinal Banzhaf rank",
-    )
-    _bar_plot_rank(
-        "lex_cel_rank",
-        "individuals_lex_cel_rank.png",
-        "lex-cel rank",
-    )
+        bars.plot_rank(values, ylabel, f"{title_prefix}{column}", out_dir / filename)
+
+    try:
+        # 値ベースの指標
+        _bar_plot("shapley", "individuals_shapley.png", "Shapley value")
+        _bar_plot("banzhaf", "individuals_banzhaf.png", "Banzhaf value")
+
+        # ランクベースの指標（値を持たない純粋な ordinal 指標のみ）
+        _bar_plot_rank(
+            "ordinal_banzhaf_rank",
+            "individuals_ordinal_banzhaf_rank.png",
+            "Ordinal Banzhaf rank",
+        )
+        _bar_plot_rank(
+            "lex_cel_rank",
+            "individuals_lex_cel_rank.png",
+            "lex-cel rank",
+        )
+    finally:
+        bars.close()
 
 
 def plot_coalitions(df: pd.DataFrame, out_dir: Path, title_prefix: str = "") -> None:
@@ -78,57 +159,54 @@ def plot_coalitions(df: pd.DataFrame, out_dir: Path, title_prefix: str = "") ->
         return
 
     # 並び順は run_manager 側で既にソート済みの DataFrame に従う
-    plot_df = df.copy()
-    coalitions = plot_df["coalition"].astype(str)
+    coalitions = list(df["coalition"].astype(str))
+    bars = _BarFigure(
+        (max(8, len(coalitions) * 0.4), 4),
+        range(len(coalitions)),
+        xticklabels=coalitions,
+    )
 
     def _bar_plot(column: str, filename: str, ylabel: str) -> None:
-        if column not in plot_df.columns:
+        if column not in df.columns:
             return
-        values = plot_df[column]
-        plt.figure(figsize=(max(8, len(coalitions) * 0.4), 4))
-        plt.bar(range(len(coalitions)), values)
-        plt.xticks(range(len(coalitions)), coalitions, rotation=90)
-        plt.ylabel(ylabel)
-        plt.title(f"{title_prefix}{column}")
-        plt.tight_layout()
-        plt.savefig(out_dir / filename)
-        plt.close()
+        bars.plot(df[column], ylabel, f"{title_prefix}{column}", out_dir / filename)
 
     def _bar_plot_rank(column: str, filename: str, ylabel: str) -> None:
-        if column not in plot_df.columns:
+        if column not in df.columns:
             return
-        values = plot_df[column]
+        values = df[column]
         if values.empty:
             return
-        max_rank = int(values.max())
-        plot_vals = max_rank + 1 - values
-        plt.figure(figsize=(max(8, len(coalitions) * 0.4), 4))
-        plt.bar(range(len(coalitions)), plot_vals)
-        plt.xticks(range(len(coalitions)), coalitions, rotation=90)
-        plt.ylabel(ylabel)
-        plt.title(f"{title_prefix}{column}")
-        ax = plt.gca()
-        ax.set_ylim(0, max_rank + 1)
-        tick_positions = [max_rank + 1 - r for r in range(1, max_rank + 1)]
-        ax.set_yticks(tick_positions)
-        ax.set_yticklabels([str(r) for r in range(1, max_rank + 1)])
-        plt.tight_layout()
-        plt.savefig(out_dir / filename)
-        plt.close()
-
-    _bar_plot("shapley_interaction", "coalitions_shapley_interaction.png", "Shapley interaction")
-    _bar_plot("banzhaf_interaction", "coalitions_banzhaf_interaction.png", "Banzhaf interaction")
-    _bar_plot("borda_interaction", "coalitions_borda_interaction.png", "Borda interaction")
-    _bar_plot(
-        "group_ordinal_banzhaf_score",
-        "coalitions_group_ordinal_banzhaf_score.png",
-        "Group Ordinal Banzhaf score",
-    )
-    _bar_plot_rank(
-        "group_lexcel_rank",
-        "coalitions_group_lexcel_rank.png",
-        "Group lex-cel rank",
-    )
+        bars.plot_rank(values, ylabel, f"{title_prefix}{column}", out_dir / filename)
+
+    try:
+        _bar_plot(
+            "shapley_interaction",
+            "coalitions_shapley_interaction.png",
+            "Shapley interaction",
+        )
+        _bar_plot(
+            "banzhaf_interaction",
+            "coalitions_banzhaf_interaction.png",
+            "Banzhaf interaction",
+        )
+        _bar_plot(
+            "borda_interaction",
+            "coalitions_borda_interaction.png",
+            "Borda interaction",
+        )
+        _bar_plot(
+            "group_ordinal_banzhaf_score",
+            "coalitions_group_ordinal_banzhaf_score.png",
+            "Group Ordinal Banzhaf score",
+        )
+        _bar_plot_rank(
+            "group_lexcel_rank",
+            "coalitions_group_lexcel_rank.png",
+            "Group lex-cel rank",
+        )
+    finally:
+        bars.close()
 
 
 def plot_rank_heatmap(
@@ -147,38 +225,15 @@ def plot_rank_heatmap(
     if len(rank_columns) < 2:
         return
 
-    data = df[rank_columns].copy()
+    data = df[rank_columns]
     if data.empty:
         return
 
-    corr = data.corr(method="spearman")
+    corr = _corr_matrix(data, method="spearman")
 
-    plt.figure(figsize=(4 + len(rank_columns), 4 + len(rank_columns)))
-    # origin=\"lower\" で縦方向を「下から上」に統一
-    im = plt.imshow(corr.values, vmin=-1, vmax=1, cmap="coolwarm", origin="lower")
-    plt.colorbar(im, fraction=0.046, pad=0.04)
-
-    tick_positions = range(len(rank_columns))
-    plt.xticks(tick_positions, rank_columns, rotation=45, ha="right")
-    plt.yticks(tick_positions, rank_columns)
-    plt.title(title)
-
-    # セルに相関係数を表示
-    for i in range(len(rank_columns)):
-        for j in range(len(rank_columns)):
-            val = corr.values[i, j]
-            plt.text(
-                j,
-                i,
-                f"{val:.2f}",
-                ha="center",
-                va="center",
-                color="black" if abs(val) < 0.6 else "white",
-            )
-
-    plt.tight_layout()
-    plt.savefig(out_dir / "individuals_rank_heatmap.png")
-    plt.close()
+    _plot_corr_heatmap(
+        corr, rank_columns, title, out_dir / "individuals_rank_heatmap.png"
+    )
 
 
 def plot_interaction_heatmap(
@@ -204,47 +259,69 @@ def plot_interaction_heatmap(
     if len(columns) < 2:
         return
 
-    data = df[columns].copy()
+    data = df[columns]
     if data.empty:
         return
 
     # スコアではなく rank 単位で比較するため、列ごとに rank 変換してから
     # 相関を計算する（Spearman 相関と同値）。
-    ranked = pd.DataFrame(index=data.index)
-    for col in columns:
-        s = data[col]
-        if col.endswith("_rank"):
-            ranked[col] = s
-        else:
-            # 大きいスコアほど良いとみなし dense ranking（1 が最大）を付与
-            ranked[col] = s.rank(method="dense", ascending=False)
+    # *_rank 列はそのまま使い、スコア列は大きいほど良いとみなして
+    # dense ranking（1 が最大）をまとめて 1 回で付与する
+    score_columns = [c for c in columns if not c.endswith("_rank")]
+    score_ranks = data[score_columns].rank(method="dense", ascending=False)
+    ranked = data.assign(**{c: score_ranks[c] for c in score_columns})
+
+    corr = _corr_matrix(ranked, method="pearson")
+
+    _plot_corr_heatmap(
+        corr, columns, title, out_dir / "coalitions_interaction_heatmap.png"
+    )
+
 
-    corr = ranked.corr(method="pearson")
+def _corr_matrix(data: pd.DataFrame, method: str) -> pd.DataFrame:
+    """``data.corr(method)`` computed with ``np.corrcoef`` when nothing is missing.
 
-    plt.figure(figsize=(4 + len(columns), 4 + len(columns)))
-    im = plt.imshow(corr.values, vmin=-1, vmax=1, cmap="coolwarm", origin="lower")
-    plt.colorbar(im, fraction=0.046, pad=0.04)
+    Spearman is Pearson on average ranks, as in pandas. With missing values
+    pandas uses pairwise-complete rows (re-ranked per pair), so that case is
+    left to ``DataFrame.corr``.
+    """
+    values = data.to_numpy(dtype=np.float64, na_value=np.nan)
+    if not np.isfinite(values).all():
+        return data.corr(method=method)
+    if method == "spearman":
+        values = data.rank().to_numpy(dtype=np.float64)
+    # 定数列は相関が定義できず NaN になる（pandas と同じ）
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = np.corrcoef(values, rowvar=False)
+    return pd.DataFrame(corr, index=data.columns, columns=data.columns)
+
+
+def _plot_corr_heatmap(
+    corr: pd.DataFrame, labels: List[str], title: str, path: Path
+) -> None:
+    """Correlation matrix heatmap with the coefficient written in each cell."""
+    values = corr.to_numpy()
+    k = len(labels)
+
+    fig = Figure(figsize=(4 + k, 4 + k))
+    ax = fig.subplots()
+    # origin=\"lower\" で縦方向を「下から上」に統一
+    im = ax.imshow(values, vmin=-1, vmax=1, cmap="coolwarm", origin="lower")
+    fig.colorbar(im, ax=ax, fraction=0.046, pad=0.04)
 
-    tick_positions = range(len(columns))
-    plt.xticks(tick_positions, columns, rotation=45, ha="right")
-    plt.yticks(tick_positions, columns)
-    plt.title(title)
+    tick_positions = range(k)
+    ax.set_xticks(tick_positions, labels, rotation=45, ha="right")
+    ax.set_yticks(tick_positions, labels)
+    ax.set_title(title)
 
-    for i in range(len(columns)):
-        for j in range(len(columns)):
-            val = corr.values[i, j]
-            plt.text(
-                j,
-                i,
-                f"{val:.2f}",
-                ha="center",
-                va="center",
-                color="black" if abs(val) < 0.6 else "white",
-            )
+    # セルに相関係数を表示（文字列と色は配列でまとめて用意する）
+    texts = np.char.mod("%.2f", values)
+    colors = np.where(np.abs(values) < 0.6, "black", "white")
+    for (i, j), text in np.ndenumerate(texts):
+        ax.text(j, i, text, ha="center", va="center", color=colors[i, j])
 
-    plt.tight_layout()
-    plt.savefig(out_dir / "coalitions_interaction_heatmap.png")
-    plt.close()
+    fig.tight_layout()
+    _savefig(path, fig)
 
 
 def plot_coalition_values(
@@ -269,9 +346,11 @@ def plot_coalition_values(
             return "{" + parts + "}"
         return str(c)
 
-    plot_df = df.copy()
-    plot_df["coal_str"] = plot_df["coalition"].map(_coalition_to_str)
-    agg = plot_df.groupby("coal_str", as_index=False)[value_column].mean()
+    # 同じ coalition は全ゲームに現れるので、文字列化はユニークな値ごとに 1 回だけ行う
+    codes, uniques = pd.factorize(df["coalition"], use_na_sentinel=False)
+    labels = np.array([_coalition_to_str(c) for c in uniques], dtype=object)
+    coal_str = pd.Series(labels[codes], index=df.index, name="coal_str")
+    agg = df[value_column].groupby(coal_str).mean().reset_index()
 
     if coalition_order is not None:
         # interactions_df の coalition 順に並べたい場合
@@ -286,11 +365,11 @@ def plot_coalition_values(
     coalitions = agg["coal_str"].astype(str)
     values = agg[value_column]
 
-    plt.figure(figsize=(max(8, len(coalitions) * 0.4), 4))
-    plt.bar(range(len(coalitions)), values)
-    plt.xticks(range(len(coalitions)), coalitions, rotation=90)
-    plt.ylabel(value_column)
-    plt.title(f"{title_prefix}{value_column}")
-    plt.tight_layout()
-    plt.savefig(out_dir / "coalitions_value.png")
-    plt.close()
+    fig = Figure(figsize=(max(8, len(coalitions) * 0.4), 4))
+    ax = fig.subplots()
+    ax.bar(range(len(coalitions)), values)
+    ax.set_xticks(range(len(coalitions)), coalitions, rotation=90)
+    ax.set_ylabel(value_column)
+    ax.set_title(f"{title_prefix}{value_column}")
+    fig.tight_layout()
+    _savefig(out_dir / "coalitions_value.png", fig)
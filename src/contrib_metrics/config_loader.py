@@ -5,10 +5,12 @@ from typing import Any, Mapping
 
 import yaml
 
+from .utils.yaml_compat import SafeLoader
+
 
 def load_config(path: Path) -> Mapping[str, Any]:
     with path.open("r", encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+        data = yaml.load(f, Loader=SafeLoader)
     if not isinstance(data, dict):
         msg = "Configuration file must contain a mapping at top level."
         raise ValueError(msg)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from itertools import combinations
+import math
 from typing import Dict
 
 from ..model.game import Game
@@ -11,29 +11,33 @@ def compute_banzhaf(game: Game, normalize: bool = True) -> Dict[int, float]:
     if n == 0:
         return {}
 
-    value_cache: dict[frozenset[int], float] = {}
-    for c, v in game.values.items():
-        value_cache[c] = float(v)
-
-    def v(coalition: frozenset[int]) -> float:
-        return value_cache.get(coalition, 0.0)
-
+    # raw[i] = sum over S not containing i of v(S | {i}) - v(S)
+    #        = 2 * sum_{S containing i} v(S) - sum_S v(S),
+    # so a single pass over the defined values suffices (missing coalitions
+    # count as 0; coalitions with members outside the roster are ignored).
+    # Both sums use math.fsum, which is exact up to the final rounding, so a
+    # null player still gets exactly 0 rather than a cancellation residue.
     players = list(game.players)
-    raw: dict[int, float] = {i: 0.0 for i in players}
-
-    for i in players:
-        others = [p for p in players if p != i]
-        for k in range(0, len(others) + 1):
-            for subset in combinations(others, k):
-                s = frozenset(subset)
-                with_i = frozenset(set(subset) | {i})
-                marginal = v(with_i) - v(s)
-                raw[i] += marginal
+    player_set = set(players)
+    containing: dict[int, list[float]] = {i: [] for i in players}
+    all_values: list[float] = []
+    for coalition, value in game.values.items():
+        if not coalition <= player_set:
+            continue
+        fv = float(value)
+        all_values.append(fv)
+        for i in coalition:
+            containing[i].append(fv)
+
+    total = math.fsum(all_values)
+    raw: dict[int, float] = {
+        i: 2.0 * math.fsum(containing[i]) - total for i in players
+    }
 
     if not normalize:
         return raw
 
-    total = sum(abs(x) for x in raw.values())
+    total = math.fsum(map(abs, raw.values()))
     if total == 0:
         return raw
     return {i: x / total for i, x in raw.items()}
@@ -1,26 +1,12 @@
 from __future__ import annotations
 
-import math
-from itertools import combinations
-from typing import Dict, Iterable, Mapping, Optional
+from functools import lru_cache
+from itertools import chain, combinations
+from typing import Dict, Iterable, Optional, Sequence
 
-from ..model.game import Coalition, Game
-
-
-def _value_cache(game: Game) -> Mapping[Coalition, float]:
-    cache: dict[Coalition, float] = {}
-    for c, v in game.values.items():
-        cache[c] = float(v)
-    return cache
+import numpy as np
 
-
-def _all_subsets(players: Iterable[int]) -> list[Coalition]:
-    p_list = list(players)
-    subsets: list[Coalition] = []
-    for k in range(len(p_list) + 1):
-        for comb in combinations(p_list, k):
-            subsets.append(frozenset(comb))
-    return subsets
+from ..model.game import Coalition, Game
 
 
 def compute_shapley_interaction(
@@ -34,63 +20,11 @@ def compute_shapley_interaction(
             sum_{T ⊆ N\\S} [(n - t - s)! t! / (n - s + 1)!]
                 * sum_{L ⊆ S} (-1)^{s-l} v(L ∪ T),
     where n = |N|, s = |S|, t = |T|, l = |L|.
-    """
-    players = list(game.players)
-    n = len(players)
-    if n == 0:
-        return {}
-
-    value_cache = _value_cache(game)
-
-    # Target coalitions S
-    if subsets is None:
-        target_subsets = [
-            frozenset(S)
-            for k in range(1, n + 1)
-            for S in combinations(players, k)
-        ]
-    else:
-        target_subsets = [frozenset(S) for S in subsets]
-
-    # Precompute factorials up to n
-    factorials = [math.factorial(k) for k in range(n + 1)]
-
-    def v(coalition: Coalition) -> float:
-        return value_cache.get(coalition, 0.0)
-
-    result: dict[Coalition, float] = {}
-
-    for S in target_subsets:
-        s = len(S)
-        if s == 0:
-            # By convention we return 0 for the empty coalition.
-            result[S] = 0.0
-            continue
-
-        outer_sum = 0.0
-        rest = [p for p in players if p not in S]
 
-        for t in range(len(rest) + 1):
-            for T_tuple in combinations(rest, t):
-                T = frozenset(T_tuple)
-
-                inner_sum = 0.0
-                # L ⊆ S
-                for l in range(s + 1):
-                    for L_tuple in combinations(S, l):
-                        L = frozenset(L_tuple)
-                        sign = -1.0 if (s - l) % 2 == 1 else 1.0
-                        inner_sum += sign * v(L | T)
-
-                coeff = (
-                    factorials[n - t - s] * factorials[t] /
-                    math.factorial(n - s + 1)
-                )
-                outer_sum += coeff * inner_sum
-
-        result[S] = outer_sum
-
-    return result
+    Evaluated through the Möbius transform m of v, using the equivalent form
+    I_v(S) = sum_{T ⊇ S} m(T) / (|T| - s + 1).
+    """
+    return compute_interactions(game, subsets, which=("shapley",))["shapley"]
 
 
 def compute_banzhaf_interaction(
@@ -103,52 +37,146 @@ def compute_banzhaf_interaction(
         I_v^B(S) =
             (1 / 2^{n-s}) * sum_{T ⊆ N\\S} sum_{L ⊆ S} (-1)^{s-l} v(L ∪ T),
     where n = |N|, s = |S|, t = |T|, l = |L|.
-    """
-    players = list(game.players)
-    n = len(players)
-    if n == 0:
-        return {}
-
-    value_cache = _value_cache(game)
-
-    # Target coalitions S
-    if subsets is None:
-        target_subsets = [
-            frozenset(S)
-            for k in range(1, n + 1)
-            for S in combinations(players, k)
-        ]
-    else:
-        target_subsets = [frozenset(S) for S in subsets]
-
-    def v(coalition: Coalition) -> float:
-        return value_cache.get(coalition, 0.0)
-
-    result: dict[Coalition, float] = {}
-
-    for S in target_subsets:
-        s = len(S)
-        if s == 0:
-            result[S] = 0.0
-            continue
-
-        rest = [p for p in players if p not in S]
-        total_sum = 0.0
 
-        for t in range(len(rest) + 1):
-            for T_tuple in combinations(rest, t):
-                T = frozenset(T_tuple)
-
-                inner_sum = 0.0
-                for l in range(s + 1):
-                    for L_tuple in combinations(S, l):
-                        L = frozenset(L_tuple)
-                        sign = -1.0 if (s - l) % 2 == 1 else 1.0
-                        inner_sum += sign * v(L | T)
+    Evaluated through the Möbius transform m of v, using the equivalent form
+    I_v^B(S) = sum_{T ⊇ S} m(T) / 2^{|T| - s}.
+    """
+    return compute_interactions(game, subsets, which=("banzhaf",))["banzhaf"]
 
-                total_sum += inner_sum
 
-        result[S] = total_sum / (2.0 ** (n - s))
+def compute_interactions(
+    game: Game,
+    subsets: Optional[Iterable[Coalition]] = None,
+    which: Sequence[str] = ("shapley", "banzhaf"),
+) -> Dict[str, Dict[Coalition, float]]:
+    """Compute several interaction indices from one Möbius transform.
 
-    return result
+    ``which`` names the indices to return ("shapley" and/or "banzhaf"); the
+    value array and its Möbius transform, the dominant cost, are built once
+    and shared between them.
+    """
+    unknown = [name for name in which if name not in _FROM_MOBIUS]
+    if unknown:
+        msg = f"Unknown interaction index: {unknown}"
+        raise ValueError(msg)
 
+    players = list(game.players)
+    n = len(players)
+    if n == 0:
+        return {name: {} for name in which}
+
+    targets = _target_masks(players, subsets)
+    m = _mobius(_value_array(game, players))
+    return {name: _collect(targets, _FROM_MOBIUS[name](m, n)) for name in which}
+
+
+def _shapley_from_mobius(m: np.ndarray, n: int) -> np.ndarray:
+    return _shapley_mobius_weights(n) @ _superset_layers(m, n)
+
+
+@lru_cache(maxsize=None)
+def _shapley_mobius_weights(n: int) -> np.ndarray:
+    """Weights 1/(j+1) of the Möbius terms m(S ∪ R) with |R| = j = 0, ..., n."""
+    weights = 1.0 / np.arange(1, n + 2, dtype=np.float64)
+    # Shared between calls, so it must stay immutable.
+    weights.setflags(write=False)
+    return weights
+
+
+def _banzhaf_from_mobius(m: np.ndarray, n: int) -> np.ndarray:
+    # Superset sum where each extra member halves the weight.
+    index = m.copy()
+    for k in range(n):
+        view = index.reshape(-1, 2, 1 << k)
+        view[:, 0, :] += 0.5 * view[:, 1, :]
+    return index
+
+
+_FROM_MOBIUS = {
+    "shapley": _shapley_from_mobius,
+    "banzhaf": _banzhaf_from_mobius,
+}
+
+
+# Coalitions are handled as bitmasks over roster positions: bit k stands for
+# ``players[k]``, so an array of length 2^n holds one entry per coalition.
+
+
+def _value_array(game: Game, players: list[int]) -> np.ndarray:
+    """v as an array indexed by coalition bitmask (0 where undefined)."""
+    position = {p: k for k, p in enumerate(players)}
+    values = np.zeros(1 << len(players), dtype=np.float64)
+    # Assigning into the float64 array casts each value, so no float() pass
+    # over game.values is needed first.
+    for coalition, value in game.values.items():
+        mask = 0
+        for p in coalition:
+            k = position.get(p)
+            if k is None:
+                # Members outside the roster never occur in L ∪ T.
+                break
+            mask |= 1 << k
+        else:
+            values[mask] = value
+    return values
+
+
+def _mobius(values: np.ndarray) -> np.ndarray:
+    """Möbius transform m(T) = sum_{L ⊆ T} (-1)^{|T|-|L|} v(L)."""
+    m = values.copy()
+    for k in range(m.size.bit_length() - 1):
+        # Axis 1 is bit k: subtract m(T - {k}) from m(T) for T containing k.
+        view = m.reshape(-1, 2, 1 << k)
+        view[:, 1, :] -= view[:, 0, :]
+    return m
+
+
+def _superset_layers(m: np.ndarray, n: int) -> np.ndarray:
+    """layers[j, S] = sum of m(T) over T ⊇ S with |T \\ S| = j."""
+    layers = np.zeros((n + 1, m.size), dtype=np.float64)
+    layers[0] = m
+    for k in range(n):
+        view = layers.reshape(n + 1, -1, 2, 1 << k)
+        view[1:, :, 0, :] += view[:-1, :, 1, :]
+    return layers
+
+
+def _target_masks(
+    players: list[int],
+    subsets: Optional[Iterable[Coalition]],
+) -> list[tuple[Coalition, int]]:
+    """Target coalitions S (all non-empty ones by default) with their masks."""
+    targets: list[tuple[Coalition, int]] = []
+    if subsets is None:
+        n = len(players)
+        for size in range(1, n + 1):
+            # Masks of all size-k position combinations at once, OR-ing the
+            # member bits row by row, in the same order as combinations().
+            positions = np.fromiter(
+                chain.from_iterable(combinations(range(n), size)), dtype=np.int64
+            ).reshape(-1, size)
+            masks = np.bitwise_or.reduce(1 << positions, axis=1).tolist()
+            targets.extend(
+                zip(map(frozenset, combinations(players, size)), masks, strict=True)
+            )
+        return targets
+
+    position = {p: k for k, p in enumerate(players)}
+    for S in subsets:
+        coalition = frozenset(S)
+        outside = coalition.difference(position)
+        if outside:
+            msg = (
+                f"Coalition {sorted(coalition)} has players outside the game: "
+                f"{sorted(outside)}"
+            )
+            raise ValueError(msg)
+        targets.append((coalition, sum(1 << position[p] for p in coalition)))
+    return targets
+
+
+def _collect(
+    targets: list[tuple[Coalition, int]], index: np.ndarray
+) -> Dict[Coalition, float]:
+    # By convention we return 0 for the empty coalition.
+    return {S: float(index[mask]) if mask else 0.0 for S, mask in targets}
@@ -1,10 +1,158 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, Mapping, Sequence
+from itertools import chain, combinations, product
+from typing import Any, Dict, Iterable, Iterator, Mapping, Sequence
+
+import numpy as np
 
 from ..model.game import Coalition, Game
 
+# Coalitions are compared through integer bitmasks: each player gets one bit
+# (see ``_encode_ranks``), so S ∪ T is ``s | t`` and T ⊆ S is ``t & s == t``
+# instead of building and hashing new frozensets.
+
+
+def _encode_ranks(game: Game) -> tuple[dict[int, int], dict[int, Any]]:
+    """Player bits and ``game.ranks`` keyed by coalition bitmask.
+
+    Roster players get bits 0..n-1 in roster order; players that only occur in
+    ranked coalitions get the following bits, so every ranked coalition has
+    its own mask.
+    """
+    ranks = game.ranks or {}
+    bits: dict[int, int] = {}
+    for p in chain(game.players, chain.from_iterable(ranks)):
+        if p not in bits:
+            bits[p] = 1 << len(bits)
+    rank_of = {sum(map(bits.__getitem__, S)): r for S, r in ranks.items()}
+    return bits, rank_of
+
+
+def _mask(coalition: Iterable[int], bits: Mapping[int, int]) -> int | None:
+    """Bitmask of a coalition, or None if it has a player without a bit.
+
+    Such a coalition (and any superset of it) is never ranked.
+    """
+    mask = 0
+    for p in coalition:
+        bit = bits.get(p)
+        if bit is None:
+            return None
+        mask |= bit
+    return mask
+
+
+def _positions(values: np.ndarray, keys: Sequence[int]) -> np.ndarray:
+    """Index of each value in ``keys`` (-1 where it does not occur)."""
+    ids = np.asarray(keys, dtype=np.int64)
+    if not len(ids):
+        return np.full(len(values), -1, dtype=np.intp)
+    order = np.argsort(ids, kind="stable")
+    at = order[np.minimum(np.searchsorted(ids, values, sorter=order), len(ids) - 1)]
+    return np.where(ids[at] == values, at, -1)
+
+
+def _layer_index(rank_values: Iterable[Any]) -> tuple[np.ndarray, int]:
+    """Layer of each rank value in the quotient ranking, and the number ell of layers.
+
+    Layer 0 is Σ_1, the layer of the smallest (best) rank value. The distinct
+    values are found by one sort (``np.unique``) instead of a dict lookup per
+    coalition.
+    """
+    layers, layer_of = np.unique(np.asarray(list(rank_values)), return_inverse=True)
+    return layer_of, len(layers)
+
+
+def _layer_counts(
+    layer: np.ndarray, col: np.ndarray, n_layers: int, n_cols: int
+) -> np.ndarray:
+    """``counts[k, j]`` = number of entries with ``(layer, col) == (k, j)``."""
+    flat = np.bincount(layer * n_cols + col, minlength=n_layers * n_cols)
+    return flat.reshape(n_layers, n_cols)
+
+
+def _superset_layer_counts(
+    masks: Iterable[int], layer_of: np.ndarray, n_layers: int, n: int
+) -> np.ndarray:
+    """``counts[t, k]`` = number of masks in layer k that contain t, for t < 2^n.
+
+    Only the low n bits of each mask are looked at.
+    """
+    low = (1 << n) - 1
+    m = np.fromiter((mask & low for mask in masks), dtype=np.int64, count=len(layer_of))
+    counts = np.bincount(m * n_layers + layer_of, minlength=(1 << n) * n_layers)
+    counts = counts.reshape(1 << n, n_layers)
+    for k in range(n):
+        # Axis 1 is bit k: add the count of T ∪ {k} to T.
+        view = counts.reshape(1 << (n - k - 1), 2, 1 << k, n_layers)
+        view[:, 0] += view[:, 1]
+    return counts
+
+
+def _score_groups(scores: Mapping[Any, Any]) -> list[list[Any]]:
+    """Keys of ``scores`` grouped by equal value, groups in increasing value order."""
+    groups: dict[Any, list[Any]] = {}
+    for key, value in scores.items():
+        groups.setdefault(value, []).append(key)
+    return [groups[value] for value in sorted(groups)]
+
+
+def _lex_relation(
+    theta: Mapping[Any, tuple[int, ...]],
+) -> tuple[frozenset[tuple[Any, Any]], frozenset[frozenset[Any]]]:
+    """(P, I) of the lexicographic order on the frequency vectors ``theta``.
+
+    P holds (a, b) with θ(a) > θ(b) and I the pairs {a, b} (a ≠ b) with
+    θ(a) = θ(b). Keys are grouped by vector and the groups sorted once, so
+    only the pairs that end up in P or I are generated.
+    """
+    # All vectors have the same length, so tuple order is the lexicographic
+    # order. Groups come from the worst up, so groups[:k] is strictly below
+    # groups[k].
+    groups = _score_groups(theta)
+    P = frozenset(
+        pair
+        for k, group in enumerate(groups)
+        for pair in product(group, chain.from_iterable(groups[:k]))
+    )
+    I = frozenset(
+        frozenset(pair) for group in groups for pair in combinations(group, 2)
+    )
+    return P, I
+
+
+def _at_least_relation(scores: Mapping[Any, Any]) -> frozenset[tuple[Any, Any]]:
+    """R = {(a, b) | scores[a] >= scores[b]}, built from the sorted score groups.
+
+    Walking the groups from the lowest score up, each group relates to
+    itself and to everything below it, so no pair is compared.
+    """
+    groups = _score_groups(scores)
+    return frozenset(
+        pair
+        for k, group in enumerate(groups)
+        for pair in product(group, chain.from_iterable(groups[: k + 1]))
+    )
+
+
+def _marginal_rank_pairs(game: Game) -> Iterator[tuple[int, Coalition, Any, Any]]:
+    """(i, S, rank(S), rank(S ∪ {i})) for i ∉ S with both coalitions ranked."""
+    bits, rank_of = _encode_ranks(game)
+    coalitions = [(S, _mask(S, bits)) for S in game.coalitions]
+    for i in game.players:
+        bit = bits[i]
+        for S, mask in coalitions:
+            if mask is None or mask & bit:
+                continue
+            r_s = rank_of.get(mask)
+            if r_s is None:
+                continue
+            r_with = rank_of.get(mask | bit)
+            if r_with is None:
+                continue
+            yield i, S, r_s, r_with
+
 
 def ordinal_marginal_contributions(game: Game) -> Dict[int, Dict[Coalition, float]]:
     """Legacy ordinal marginal contribution based on rank differences.
@@ -15,22 +163,10 @@ def ordinal_marginal_contributions(game: Game) -> Dict[int, Dict[Coalition, floa
         msg = "Game.ranks must be defined for ordinal metrics."
         raise ValueError(msg)
 
-    players = list(game.players)
-    coalitions = list(game.coalitions)
-    ranks = game.ranks
-
-    result: dict[int, dict[Coalition, float]] = {i: {} for i in players}
+    result: dict[int, dict[Coalition, float]] = {i: {} for i in game.players}
 
-    for i in players:
-        for S in coalitions:
-            if i in S:
-                continue
-            s = S
-            with_i = frozenset(set(S) | {i})
-            if s not in ranks or with_i not in ranks:
-                continue
-            m = float(ranks[with_i] - ranks[s])
-            result[i][s] = m
+    for i, S, r_s, r_with in _marginal_rank_pairs(game):
+        result[i][S] = float(r_with - r_s)
 
     return result
 
@@ -59,29 +195,16 @@ def ordinal_marginal_contributions_sign(game: Game) -> Dict[int, Dict[Coalition,
         msg = "Game.ranks must be defined for ordinal metrics."
         raise ValueError(msg)
 
-    players = list(game.players)
-    coalitions = list(game.coalitions)
-    ranks = game.ranks
-
-    result: dict[int, dict[Coalition, int]] = {i: {} for i in players}
+    result: dict[int, dict[Coalition, int]] = {i: {} for i in game.players}
 
-    for i in players:
-        for S in coalitions:
-            if i in S:
-                continue
-            s = S
-            with_i = frozenset(set(S) | {i})
-            if s not in ranks or with_i not in ranks:
-                continue
-            r_s = ranks[s]
-            r_with = ranks[with_i]
-            if r_with < r_s:
-                m = 1
-            elif r_s < r_with:
-                m = -1
-            else:
-                m = 0
-            result[i][s] = m
+    for i, S, r_s, r_with in _marginal_rank_pairs(game):
+        if r_with < r_s:
+            m = 1
+        elif r_s < r_with:
+            m = -1
+        else:
+            m = 0
+        result[i][S] = m
 
     return result
 
@@ -112,15 +235,7 @@ class OrdinalBanzhafRelation:
 def compute_ordinal_banzhaf_relation(game: Game) -> OrdinalBanzhafRelation:
     """Compute the Ordinal Banzhaf relation from coalition ranking."""
     scores = compute_ordinal_banzhaf_scores(game)
-    players = list(scores.keys())
-
-    R: set[tuple[int, int]] = set()
-    for i in players:
-        for j in players:
-            if scores[i] >= scores[j]:
-                R.add((i, j))
-
-    return OrdinalBanzhafRelation(scores=scores, R=frozenset(R))
+    return OrdinalBanzhafRelation(scores=scores, R=_at_least_relation(scores))
 
 
 @dataclass(frozen=True)
@@ -148,52 +263,71 @@ def compute_lex_cel(game: Game) -> LexCelRelation:
         raise ValueError(msg)
 
     ranks = game.ranks
-    players = list(game.players)
+    roster = list(dict.fromkeys(game.players))
 
     # Build quotient ranking: layers Sigma_1, ..., Sigma_ell
-    layer_values = sorted({r for r in ranks.values()})
-    layers: list[list[Coalition]] = [[] for _ in layer_values]
-    value_to_index = {v: idx for idx, v in enumerate(layer_values)}
-
-    for coalition, r in ranks.items():
-        idx = value_to_index[r]
-        layers[idx].append(coalition)
-
-    # Compute frequency vectors theta(i) = (i_1, ..., i_ell)
-    theta: dict[int, list[int]] = {i: [0] * len(layers) for i in players}
-    for k, coalitions in enumerate(layers):
-        for S in coalitions:
-            for i in S:
-                if i in theta:
-                    theta[i][k] += 1
-
-    # Lexicographic comparison helper: returns 1 if a > b, -1 if a < b, 0 if equal.
-    def _lex_cmp(a: Sequence[int], b: Sequence[int]) -> int:
-        for x, y in zip(a, b):
-            if x > y:
-                return 1
-            if x < y:
-                return -1
-        return 0
-
-    P: set[tuple[int, int]] = set()
-    I: set[frozenset[int]] = set()
-
-    for i in players:
-        for j in players:
-            if i == j:
-                continue
-            cmp = _lex_cmp(theta[i], theta[j])
-            if cmp > 0:
-                P.add((i, j))
-            elif cmp == 0:
-                I.add(frozenset({i, j}))
-
-    return LexCelRelation(
-        theta={i: tuple(v) for i, v in theta.items()},
-        P=frozenset(P),
-        I=frozenset(I),
+    layer_of, n_layers = _layer_index(ranks.values())
+
+    # Compute frequency vectors theta(i) = (i_1, ..., i_ell): every member of a
+    # coalition adds one to its layer's entry (members outside the roster are
+    # not counted). All (coalition, member) pairs are handled in one pass.
+    members = np.fromiter(chain.from_iterable(ranks), dtype=np.int64)
+    sizes = np.fromiter(map(len, ranks), dtype=np.intp, count=len(ranks))
+    pos = _positions(members, roster)
+    inside = pos >= 0
+    counts = _layer_counts(
+        np.repeat(layer_of, sizes)[inside],
+        pos[inside],
+        n_layers,
+        len(roster),
     )
+    theta: dict[int, list[int]] = dict(zip(roster, counts.T.tolist(), strict=True))
+
+    theta_tup = {i: tuple(v) for i, v in theta.items()}
+    P, I = _lex_relation(theta_tup)
+    return LexCelRelation(theta=theta_tup, P=P, I=I)
+
+
+def _group_ordinal_table(rank_of: Mapping[int, Any], n: int) -> np.ndarray:
+    """``table[t]`` = s_T for every coalition mask t < 2^n of the roster.
+
+    Every disjoint pair (S, T) of roster coalitions is visited once (3^n in
+    all). The pairs over the low bits are built once as arrays; each way of
+    giving the high bits to S, T or neither shifts them into one block, so
+    memory stays at 3^low entries per block.
+    """
+    # layer[m]: layer of coalition m, -1 where it is unranked (or its rank is
+    # NaN, which compares neither better nor worse than anything).
+    layer = np.full(1 << n, -1, dtype=np.intp)
+    layer_of, _ = _layer_index(rank_of.values())
+    masks = np.fromiter(rank_of, dtype=object, count=len(rank_of))
+    rank_values = np.asarray(list(rank_of.values()))
+    keep = masks < (1 << n)
+    if rank_values.dtype.kind == "f":
+        keep &= ~np.isnan(rank_values)
+    layer[masks[keep].astype(np.int64)] = layer_of[keep]
+
+    low = min(n, 10)
+    s_low = np.zeros(1, dtype=np.int64)
+    t_low = np.zeros(1, dtype=np.int64)
+    for k in range(low):
+        # Player k goes to neither, S or T.
+        bit = 1 << k
+        s_low = np.concatenate((s_low, s_low | bit, s_low))
+        t_low = np.concatenate((t_low, t_low, t_low | bit))
+
+    table = np.zeros(1 << n, dtype=np.int64)
+    for owners in product(range(3), repeat=n - low):
+        s_high = sum(1 << (low + k) for k, o in enumerate(owners) if o == 1)
+        t_high = sum(1 << (low + k) for k, o in enumerate(owners) if o == 2)
+        r_s = layer[s_low | s_high]
+        r_with = layer[s_low | t_low | s_high | t_high]
+        # m_T^S = 1 if S ∪ T is in a better (smaller) layer than S, -1 if worse.
+        m = np.where((r_s >= 0) & (r_with >= 0), np.sign(r_s - r_with), 0)
+        table[t_high : t_high + (1 << low)] += np.bincount(
+            t_low, weights=m, minlength=1 << low
+        ).astype(np.int64)
+    return table
 
 
 def compute_group_ordinal_banzhaf_scores(
@@ -216,7 +350,6 @@ def compute_group_ordinal_banzhaf_scores(
         msg = "Game.ranks must be defined for group ordinal Banzhaf."
         raise ValueError(msg)
 
-    ranks = game.ranks
     players = list(game.players)
     n = len(players)
 
@@ -225,13 +358,20 @@ def compute_group_ordinal_banzhaf_scores(
         target_subsets: list[Coalition] = [
             frozenset(S)
             for k in range(1, n + 1)
-            for S in __import__("itertools").combinations(players, k)
+            for S in combinations(players, k)
         ]
     else:
         target_subsets = [frozenset(T) for T in subsets]
 
-    # プレイヤー集合を固定
-    from itertools import combinations
+    # プレイヤー集合を固定（bitmask 表現）
+    bits, rank_of = _encode_ranks(game)
+    roster = _mask(set(players), bits) or 0
+
+    if subsets is None:
+        # 全 T ⊆ N を一度に: 互いに素な (S, T) の組をまとめて走査する
+        table = _group_ordinal_table(rank_of, len(dict.fromkeys(players)))
+        rows = table[[_mask(T, bits) for T in target_subsets]].tolist()
+        return dict(zip(target_subsets, rows, strict=True))
 
     scores: dict[Coalition, int] = {}
 
@@ -240,24 +380,26 @@ def compute_group_ordinal_banzhaf_scores(
             scores[T] = 0
             continue
 
-        rest = [p for p in players if p not in T]
         u_plus = 0
         u_minus = 0
 
-        for k in range(len(rest) + 1):
-            for S_tuple in combinations(rest, k):
-                S = frozenset(S_tuple)
-                with_T = frozenset(set(S) | set(T))
-                if S not in ranks or with_T not in ranks:
-                    continue
-
-                r_S = ranks[S]
-                r_with = ranks[with_T]
-
-                if r_with < r_S:
-                    u_plus += 1
-                elif r_S < r_with:
-                    u_minus += 1
+        t = _mask(T, bits)
+        if t is not None:
+            # S は N \ T の部分集合をすべて走査する（submask 列挙）
+            rest = roster & ~t
+            S = rest
+            while True:
+                r_S = rank_of.get(S)
+                if r_S is not None:
+                    r_with = rank_of.get(S | t)
+                    if r_with is not None:
+                        if r_with < r_S:
+                            u_plus += 1
+                        elif r_S < r_with:
+                            u_minus += 1
+                if not S:
+                    break
+                S = (S - 1) & rest
 
         scores[T] = u_plus - u_minus
 
@@ -278,15 +420,7 @@ def compute_group_ordinal_banzhaf_relation(
 ) -> GroupOrdinalBanzhafRelation:
     """Compute the group ordinal Banzhaf relation over coalitions."""
     scores = compute_group_ordinal_banzhaf_scores(game, subsets=subsets)
-    coalitions = list(scores.keys())
-
-    R: set[tuple[Coalition, Coalition]] = set()
-    for S in coalitions:
-        for T in coalitions:
-            if scores[S] >= scores[T]:
-                R.add((S, T))
-
-    return GroupOrdinalBanzhafRelation(scores=scores, R=frozenset(R))
+    return GroupOrdinalBanzhafRelation(scores=scores, R=_at_least_relation(scores))
 
 
 @dataclass(frozen=True)
@@ -312,25 +446,31 @@ def compute_group_lex_cel(
     For each nonempty coalition T, we build Θ_≽(T) = (T_1, ..., T_ell) where
     T_k = |{ S ∈ Σ_k | T ⊆ S }|, and compare lexicographically.
     """
+    theta = compute_group_lex_cel_theta(game, subsets=subsets)
+    P, I = _lex_relation(theta)
+    return GroupLexCelRelation(theta=theta, P=P, I=I)
+
+
+def compute_group_lex_cel_theta(
+    game: Game,
+    subsets: Iterable[Coalition] | None = None,
+) -> Dict[Coalition, tuple[int, ...]]:
+    """Frequency vectors Θ_≽(T) of the group lex-cel relation.
+
+    Same vectors as ``compute_group_lex_cel(...).theta`` without building P
+    and I, which hold O(|targets|²) pairs.
+    """
     if game.ranks is None:
         msg = "Game.ranks must be defined for group lex-cel."
         raise ValueError(msg)
 
-    ranks = game.ranks
     players = list(game.players)
+    bits, rank_of = _encode_ranks(game)
 
-    # Build quotient ranking: layers Σ_1, ..., Σ_ell
-    layer_values = sorted({r for r in ranks.values()})
-    layers: list[list[Coalition]] = [[] for _ in layer_values]
-    value_to_index = {v: idx for idx, v in enumerate(layer_values)}
-
-    for coalition, r in ranks.items():
-        idx = value_to_index[r]
-        layers[idx].append(coalition)
+    # Build quotient ranking: layers Σ_1, ..., Σ_ell (coalitions as bitmasks)
+    layer_of, n_layers = _layer_index(rank_of.values())
 
     # Target coalitions T: nonempty coalitions over N (or restricted subsets)
-    from itertools import combinations
-
     n = len(players)
     if subsets is None:
         target_subsets: list[Coalition] = [
@@ -342,42 +482,30 @@ def compute_group_lex_cel(
         target_subsets = [frozenset(T) for T in subsets if T]
 
     # Compute frequency vectors Θ(T) = (T_1, ..., T_ell)
-    theta: dict[Coalition, list[int]] = {
-        T: [0] * len(layers) for T in target_subsets
-    }
-    for k, coalitions in enumerate(layers):
-        for S in coalitions:
-            for T in target_subsets:
-                if T.issubset(S):
-                    theta[T][k] += 1
-
-    # Lexicographic comparison helper
-    def _lex_cmp(a: Sequence[int], b: Sequence[int]) -> int:
-        for x, y in zip(a, b):
-            if x > y:
-                return 1
-            if x < y:
-                return -1
-        return 0
-
-    P: set[tuple[Coalition, Coalition]] = set()
-    I: set[frozenset[Coalition]] = set()
-
-    for T in target_subsets:
-        for U in target_subsets:
-            if T == U:
-                continue
-            cmp = _lex_cmp(theta[T], theta[U])
-            if cmp > 0:
-                P.add((T, U))
-            elif cmp == 0:
-                I.add(frozenset({T, U}))
-
-    return GroupLexCelRelation(
-        theta={T: tuple(v) for T, v in theta.items()},
-        P=frozenset(P),
-        I=frozenset(I),
-    )
+    theta: dict[Coalition, list[int]]
+    if subsets is None:
+        # Every T ⊆ N at once: superset sums of the per-layer coalition counts.
+        table = _superset_layer_counts(
+            rank_of, layer_of, n_layers, len(dict.fromkeys(players))
+        )
+        rows = table[[_mask(T, bits) for T in target_subsets]].tolist()
+        theta = dict(zip(target_subsets, rows, strict=True))
+    else:
+        # Explicit targets: one vectorized T ⊆ S test per target. Masks only
+        # fit in int64 while there are fewer than 64 players in play.
+        mask_arr = np.fromiter(
+            rank_of, dtype=np.int64 if len(bits) < 64 else object, count=len(rank_of)
+        )
+        counts = {T: np.zeros(n_layers, dtype=np.int64) for T in target_subsets}
+        for T in target_subsets:
+            t = _mask(T, bits)
+            # T with a player outside every ranked coalition is a subset of none.
+            if t is not None:
+                hit = ((mask_arr & t) == t).astype(bool)
+                counts[T] += np.bincount(layer_of[hit], minlength=n_layers)
+        theta = {T: v.tolist() for T, v in counts.items()}
+
+    return {T: tuple(v) for T, v in theta.items()}
 
 
 def compute_borda_scores(game: Game) -> Dict[Coalition, int]:
@@ -2,41 +2,62 @@ from __future__ import annotations
 
 import math
 import random
-from itertools import combinations, permutations
-from typing import Dict, Iterable
+from functools import lru_cache
+from typing import Dict
+
+import numpy as np
 
 from ..model.game import Game
+from .interactions import _value_array
 
 
 def compute_shapley_exact(game: Game) -> Dict[int, float]:
+    """Exact Shapley values from one pass over the coalition bitmasks.
+
+    The size coefficients come from :func:`shapley_weights`, which is cached
+    so games of the same size share one table.
+    """
     n = len(game.players)
     if n == 0:
         return {}
 
-    factorials = [math.factorial(k) for k in range(n + 1)]
-    total_factorial = factorials[n]
-
-    value_cache = _value_cache(game)
-    indices: dict[int, float] = {i: 0.0 for i in game.players}
     players = list(game.players)
-
-    for i in players:
-        others = [p for p in players if p != i]
-        for k in range(0, len(others) + 1):
-            for subset in combinations(others, k):
-                s = frozenset(subset)
-                with_i = frozenset(set(subset) | {i})
-                weight = (
-                    factorials[len(s)]
-                    * factorials[n - len(s) - 1]
-                    / total_factorial
-                )
-                marginal = value_cache.get(with_i, 0.0) - value_cache.get(s, 0.0)
-                indices[i] += weight * marginal
+    values = _value_array(game, players)
+    # Coefficient of every coalition S by its size; the grand coalition never
+    # occurs without a player, so its entry is unused.
+    by_size = np.append(shapley_weights(n), 0.0)
+    coef = by_size[_coalition_sizes(n)]
+
+    indices: dict[int, float] = {}
+    for k, i in enumerate(players):
+        # Axis 1 is bit k: [:, 0] holds S without player i, [:, 1] S ∪ {i}.
+        v = values.reshape(-1, 2, 1 << k)
+        c = coef.reshape(-1, 2, 1 << k)[:, 0, :]
+        indices[i] = float(np.sum(c * (v[:, 1, :] - v[:, 0, :])))
 
     return indices
 
 
+@lru_cache(maxsize=None)
+def _coalition_sizes(n: int) -> np.ndarray:
+    """|S| for every coalition bitmask S < 2^n."""
+    sizes = np.zeros(1 << n, dtype=np.intp)
+    for k in range(n):
+        sizes.reshape(-1, 2, 1 << k)[:, 1, :] += 1
+    # Shared between calls, so it must stay immutable.
+    sizes.setflags(write=False)
+    return sizes
+
+
+@lru_cache(maxsize=None)
+def shapley_weights(n: int) -> tuple[float, ...]:
+    """Shapley coefficients s!(n-s-1)!/n! for s = 0, ..., n-1."""
+    factorials = [math.factorial(k) for k in range(n + 1)]
+    return tuple(
+        factorials[s] * factorials[n - s - 1] / factorials[n] for s in range(n)
+    )
+
+
 def compute_shapley_mc(
     game: Game,
     num_samples: int = 1000,
@@ -49,30 +70,43 @@ def compute_shapley_mc(
     if n == 0 or num_samples <= 0:
         return {i: 0.0 for i in game.players}
 
-    value_cache = _value_cache(game)
     players = list(game.players)
-    indices: dict[int, float] = {i: 0.0 for i in players}
+    value_of = _mask_values(game, players)
+    totals = [0.0] * n
+    positions = list(range(n))
 
+    # Shuffling roster positions draws the same permutations from ``rng`` as
+    # shuffling the players themselves; the growing coalition is a bitmask.
     for _ in range(num_samples):
-        perm = players[:]
+        perm = positions[:]
         rng.shuffle(perm)
-        coalition: set[int] = set()
+        mask = 0
         prev_value = 0.0
 
-        for i in perm:
-            coalition.add(i)
-            current_value = value_cache.get(frozenset(coalition), 0.0)
-            indices[i] += current_value - prev_value
+        for k in perm:
+            mask |= 1 << k
+            current_value = value_of.get(mask, 0.0)
+            totals[k] += current_value - prev_value
             prev_value = current_value
 
-    for i in players:
-        indices[i] /= num_samples
+    return {i: total / num_samples for i, total in zip(players, totals, strict=True)}
 
-    return indices
 
+def _mask_values(game: Game, players: list[int]) -> dict[int, float]:
+    """v keyed by coalition bitmask over roster positions.
 
-def _value_cache(game: Game) -> dict[frozenset[int], float]:
-    cache: dict[frozenset[int], float] = {}
+    Coalitions with a member outside the roster are left out: a permutation
+    of the roster never builds them.
+    """
+    position = {p: k for k, p in enumerate(players)}
+    value_of: dict[int, float] = {}
     for coalition, value in game.values.items():
-        cache[coalition] = float(value)
-    return cache
+        mask = 0
+        for p in coalition:
+            k = position.get(p)
+            if k is None:
+                break
+            mask |= 1 << k
+        else:
+            value_of[mask] = float(value)
+    return value_of
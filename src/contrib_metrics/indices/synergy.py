@@ -1,21 +1,37 @@
 from __future__ import annotations
 
-from typing import Dict, Iterable
+from itertools import chain, repeat
+from typing import Dict
+
+import numpy as np
 
 from ..model.game import Coalition, Game
 
 
 def compute_synergy(game: Game) -> Dict[Coalition, float]:
-    base_singletons = {frozenset({i}): game.value({i}) for i in game.players}
-    result: dict[Coalition, float] = {}
-    for coalition in game.coalitions:
-        if not coalition:
-            result[coalition] = 0.0
-            continue
-        v_s = game.value(coalition)
-        singles_sum = sum(base_singletons.get(frozenset({i}), 0.0) for i in coalition)
-        result[coalition] = v_s - singles_sum
-    return result
+    """Synergy v(S) - sum_{i in S} v({i}) of every coalition (0 for the empty one)."""
+    coalitions = list(game.coalitions)
+    # v({i}) keyed by the player itself, so the lookups allocate no singletons.
+    singles = {i: game.value({i}) for i in game.players}
+
+    # One flat pass over all (coalition, member) pairs; bincount then sums each
+    # coalition's singleton values in member order.
+    sizes = np.fromiter(map(len, coalitions), dtype=np.intp, count=len(coalitions))
+    member_values = np.fromiter(
+        map(singles.get, chain.from_iterable(coalitions), repeat(0.0)),
+        dtype=np.float64,
+        count=int(sizes.sum()),
+    )
+    singles_sum = np.bincount(
+        np.repeat(np.arange(len(coalitions)), sizes),
+        weights=member_values,
+        minlength=len(coalitions),
+    )
+    v = np.fromiter(
+        map(game.value, coalitions), dtype=np.float64, count=len(coalitions)
+    )
+    synergy = np.where(sizes > 0, v - singles_sum, 0.0)
+    return dict(zip(coalitions, synergy.tolist(), strict=True))
 
 
 class SynergyCalculator:
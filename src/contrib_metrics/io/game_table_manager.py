@@ -5,9 +5,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Optional
 
+import os
 import shutil
 import yaml
 
+from ..utils.yaml_compat import SafeDumper, SafeLoader
+
 
 @dataclass
 class GameTableRun:
@@ -34,79 +37,121 @@ def list_runs(kind: str, root: Path | str = Path("data/game_tables")) -> List[Ga
     if not base.exists():
         return []
 
-    runs: list[GameTableRun] = []
-
-    # 1) Simple layout: kind/kind_001.csv, kind_002.csv, ...
-    for entry in sorted(base.iterdir()):
-        if not entry.is_file():
-            continue
-        name = entry.name
-        stem = entry.stem
-        if not stem.startswith(f"{kind}_"):
-            continue
-        suffix = stem.split("_", 1)[1]
-        try:
-            run_id = int(suffix)
-        except ValueError:
-            continue
-        fmt = entry.suffix.lstrip(".").lower()
-        created_at = datetime.fromtimestamp(entry.stat().st_mtime, tz=timezone.utc)
-        runs.append(
-            GameTableRun(
-                kind=kind,
-                run_id=run_id,
-                path=entry,
-                format=fmt,
-                created_at=created_at,
-                metadata_path=None,
-            )
-        )
-
-    # 2) Managed layout: kind/run_0001/..., with metadata.yaml
-    for entry in sorted(base.iterdir()):
-        if not entry.is_dir():
-            continue
-        name = entry.name
-        if not name.startswith("run_"):
-            continue
-        try:
-            run_id = int(name.split("_", 1)[1])
-        except ValueError:
-            continue
+    # One directory scan serves both layouts; DirEntry caches the file type
+    # and stat result, so no extra syscalls are made per entry.
+    with os.scandir(base) as it:
+        entries = sorted(it, key=lambda e: e.name)
+
+    simple: list[GameTableRun] = []
+    managed: list[GameTableRun] = []
+    for entry in entries:
+        if entry.is_file():
+            run = _simple_run(kind, entry)
+            if run is not None:
+                simple.append(run)
+        elif entry.is_dir():
+            run = _managed_run(kind, entry)
+            if run is not None:
+                managed.append(run)
+
+    runs = simple + managed
+    runs.sort(key=lambda r: r.run_id)
+    return runs
+
+
+def _simple_run(kind: str, entry: os.DirEntry[str]) -> Optional[GameTableRun]:
+    """Simple layout: kind/kind_001.csv, kind_002.csv, ..."""
+    path = Path(entry.path)
+    run_id = _simple_run_id(kind, path.stem)
+    if run_id is None:
+        return None
+    fmt = path.suffix.lstrip(".").lower()
+    created_at = datetime.fromtimestamp(entry.stat().st_mtime, tz=timezone.utc)
+    return GameTableRun(
+        kind=kind,
+        run_id=run_id,
+        path=path,
+        format=fmt,
+        created_at=created_at,
+        metadata_path=None,
+    )
 
-        meta_path = entry / "metadata.yaml"
-        if not meta_path.exists():
-            continue
 
+def _managed_run(kind: str, entry: os.DirEntry[str]) -> Optional[GameTableRun]:
+    """Managed layout: kind/run_0001/..., with metadata.yaml"""
+    run_id = _managed_run_id(entry.name)
+    if run_id is None:
+        return None
+
+    run_dir = Path(entry.path)
+    meta_path = run_dir / "metadata.yaml"
+    try:
         with meta_path.open("r", encoding="utf-8") as f:
-            meta = yaml.safe_load(f) or {}
-
-        fmt = str(meta.get("format", "") or "")
-        filename = meta.get("filename", "game_table.csv")
-        table_path = entry / filename
-
-        created_raw = meta.get("created_at")
-        if isinstance(created_raw, str):
-            try:
-                created_at = datetime.fromisoformat(created_raw)
-            except ValueError:
-                created_at = datetime.now(timezone.utc)
-        else:
+            meta = yaml.load(f, Loader=SafeLoader) or {}
+    except FileNotFoundError:
+        return None
+
+    fmt = str(meta.get("format", "") or "")
+    filename = meta.get("filename", "game_table.csv")
+    table_path = run_dir / filename
+
+    created_raw = meta.get("created_at")
+    if isinstance(created_raw, str):
+        try:
+            created_at = datetime.fromisoformat(created_raw)
+        except ValueError:
             created_at = datetime.now(timezone.utc)
+    else:
+        created_at = datetime.now(timezone.utc)
+
+    return GameTableRun(
+        kind=kind,
+        run_id=run_id,
+        path=table_path,
+        format=fmt,
+        created_at=created_at,
+        metadata_path=meta_path,
+    )
 
-        runs.append(
-            GameTableRun(
-                kind=kind,
-                run_id=run_id,
-                path=table_path,
-                format=fmt,
-                created_at=created_at,
-                metadata_path=meta_path,
-            )
-        )
 
-    runs.sort(key=lambda r: r.run_id)
-    return runs
+def _simple_run_id(kind: str, stem: str) -> Optional[int]:
+    """run_id of a simple-layout file stem ``<kind>_NNN`` (None otherwise)."""
+    if not stem.startswith(f"{kind}_"):
+        return None
+    try:
+        return int(stem.split("_", 1)[1])
+    except ValueError:
+        return None
+
+
+def _managed_run_id(name: str) -> Optional[int]:
+    """run_id of a managed-layout directory ``run_NNNN`` (None otherwise)."""
+    if not name.startswith("run_"):
+        return None
+    try:
+        return int(name.split("_", 1)[1])
+    except ValueError:
+        return None
+
+
+def _next_run_id(kind: str, kind_dir: Path) -> int:
+    """One past the highest run_id under ``kind_dir``, read from entry names.
+
+    No metadata is parsed. Run directories count even without a
+    metadata.yaml, so a half-written run is never reused.
+    """
+    highest = 0
+    with os.scandir(kind_dir) as it:
+        for entry in it:
+            if entry.is_file():
+                run_id = _simple_run_id(kind, Path(entry.name).stem)
+            elif entry.is_dir():
+                run_id = _managed_run_id(entry.name)
+            else:
+                continue
+            if run_id is not None:
+                highest = max(highest, run_id)
+    return highest + 1
 
 
 def get_latest_run(kind: str, root: Path | str = Path("data/game_tables")) -> Optional[GameTableRun]:
@@ -135,8 +180,7 @@ def register_game_table(
     kind_dir = _kind_root(root_path, kind)
     kind_dir.mkdir(parents=True, exist_ok=True)
 
-    existing = list_runs(kind=kind, root=root_path)
-    next_id = existing[-1].run_id + 1 if existing else 1
+    next_id = _next_run_id(kind, kind_dir)
 
     run_dir = kind_dir / f"run_{next_id:04d}"
     run_dir.mkdir()
@@ -165,7 +209,7 @@ def register_game_table(
 
     metadata_path = run_dir / "metadata.yaml"
     with metadata_path.open("w", encoding="utf-8") as f:
-        yaml.safe_dump(meta, f, sort_keys=False)
+        yaml.dump(meta, f, Dumper=SafeDumper, sort_keys=False)
 
     return GameTableRun(
         kind=kind,
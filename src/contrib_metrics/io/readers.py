@@ -1,9 +1,13 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
 
 from ..utils.coalition_encoding import normalize_coalition
 
@@ -12,29 +16,115 @@ def read_game_table(
     path: str | Path,
     fmt: str | None = None,
     coalition_column: str = "coalition",
+    columns: Iterable[str] | None = None,
+    chunk_size: int = 65536,
 ) -> pd.DataFrame:
+    """Read a game table, normalizing its coalition column to frozensets.
+
+    ``columns`` restricts the read to those columns (plus the coalition
+    column); names missing from the file are ignored. By default every column
+    is read. Parquet files are read ``chunk_size`` rows at a time and each
+    chunk is normalized before the next one is decoded; the result has a
+    fresh ``RangeIndex``.
+    """
     p = Path(path)
     if fmt is None:
         fmt = p.suffix.lstrip(".").lower()
 
+    wanted: set[str] | None = None
+    if columns is not None:
+        wanted = {*columns, coalition_column}
+
     if fmt == "csv":
-        df = pd.read_csv(p)
-    elif fmt in {"parquet", "pq"}:
-        df = pd.read_parquet(p)
-    else:
-        msg = f"Unsupported format: {fmt}"
-        raise ValueError(msg)
+        df = _read_csv(p, wanted)
+        _check_coalition_column(df.columns, coalition_column)
+        return _normalize_coalitions(df, coalition_column)
+    if fmt in {"parquet", "pq"}:
+        return _read_parquet(p, wanted, coalition_column, chunk_size)
+    msg = f"Unsupported format: {fmt}"
+    raise ValueError(msg)
+
+
+def _read_csv(path: Path, wanted: set[str] | None) -> pd.DataFrame:
+    # Arrow's reader parses on several threads and rounds floats correctly.
+    include = None
+    if wanted is not None:
+        # Only project columns the file has; the order follows the file.
+        with pacsv.open_csv(path) as reader:
+            names = reader.schema.names
+        include = [name for name in names if name in wanted]
+    options = pacsv.ConvertOptions(include_columns=include, strings_can_be_null=True)
+    table = pacsv.read_csv(path, convert_options=options)
+    # An all-empty column is Arrow's null type; pandas reads it as NaN floats
+    # (or as object columns when the file has no rows at all).
+    empty_type = pa.float64() if table.num_rows else pa.string()
+    fields = [
+        pa.field(f.name, empty_type) if pa.types.is_null(f.type) else f
+        for f in table.schema
+    ]
+    return table.cast(pa.schema(fields)).to_pandas(self_destruct=True)
+
+
+def _read_parquet(
+    path: Path, wanted: set[str] | None, coalition_column: str, chunk_size: int
+) -> pd.DataFrame:
+    pf = pq.ParquetFile(path)
+    schema = pf.schema_arrow
+    # Only project columns the file has; the order follows the file.
+    cols = [
+        name
+        for name in schema.names
+        if not name.startswith("__index_level_") and (wanted is None or name in wanted)
+    ]
+    _check_coalition_column(cols, coalition_column)
+
+    chunks = [
+        _normalize_coalitions(batch.to_pandas(), coalition_column)
+        for batch in pf.iter_batches(batch_size=chunk_size, columns=cols)
+    ]
+    if not chunks:
+        empty = schema.empty_table().select(cols).to_pandas()
+        return _normalize_coalitions(empty, coalition_column)
+    return pd.concat(chunks, ignore_index=True, copy=False)
 
-    if coalition_column not in df.columns:
+
+def _check_coalition_column(names: Iterable[str], coalition_column: str) -> None:
+    if coalition_column not in names:
         msg = "Input table must contain 'coalition' column."
         raise ValueError(msg)
 
-    df = df.copy()
+
+def _normalize_coalitions(df: pd.DataFrame, coalition_column: str) -> pd.DataFrame:
     if coalition_column != "coalition":
         df = df.rename(columns={coalition_column: "coalition"})
-    df["coalition"] = df["coalition"].map(_normalize_coalition_cell)
+    df["coalition"] = _normalize_coalition_column(df["coalition"])
     return df
 
 
-def _normalize_coalition_cell(value: Any) -> frozenset[int]:
+def _normalize_coalition_column(column: pd.Series) -> pd.Series:
+    """Normalize each distinct cell once and broadcast back by its code.
+
+    A table repeats the same few coalitions in every game, so this parses
+    O(distinct) cells instead of one per row. Missing cells become empty
+    coalitions, as ``normalize_coalition`` does for them.
+    """
+    try:
+        codes, uniques = pd.factorize(column)
+    except TypeError:
+        # Unhashable cells: a list column (e.g. Parquet list<int>) holds the
+        # members directly, as arrays or lists.
+        members = [_members_cell(value) for value in column.to_numpy()]
+        return pd.Series(members, index=column.index, name=column.name, dtype=object)
+    # The last slot is what code -1 (a missing cell) picks up.
+    lookup = np.empty(len(uniques) + 1, dtype=object)
+    for i, value in enumerate(uniques.tolist()):
+        lookup[i] = normalize_coalition(value)
+    lookup[-1] = frozenset()
+    return pd.Series(lookup[codes], index=column.index, name=column.name)
+
+
+def _members_cell(value: Any) -> frozenset[int]:
+    if isinstance(value, np.ndarray):
+        # Members are cast to int like any other list (e.g. list<string>).
+        value = value.tolist()
     return normalize_coalition(value)
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+from functools import lru_cache
 from importlib import resources
 from typing import Any, Mapping
 
@@ -15,11 +17,15 @@ def validate_game_table(df: pd.DataFrame) -> None:
         raise ValueError(msg)
 
 
+@lru_cache(maxsize=1)
 def load_schema() -> Mapping[str, Any]:
-    """Load JSON schema for game table (for future extensions)."""
-    with resources.files("contrib_metrics").joinpath(
-        "../../data/schema/game_table_schema.json"
-    ).open("r", encoding="utf-8") as f:
-        import json
+    """Load JSON schema for game table (for future extensions).
 
+    The schema is parsed once; callers share the returned mapping and must not
+    modify it.
+    """
+    schema = resources.files("contrib_metrics").joinpath(
+        "schemas/game_table_schema.json"
+    )
+    with schema.open("r", encoding="utf-8") as f:
         return json.load(f)
@@ -3,11 +3,25 @@ from __future__ import annotations
 from pathlib import Path
 
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# Rows converted to Arrow per Parquet write (one row group each); bounds the
+# extra memory needed on top of the DataFrame itself.
+_PARQUET_BATCH_ROWS = 65_536
 
 
 def write_table(
-    df: pd.DataFrame, path: str | Path, fmt: str | None = None
+    df: pd.DataFrame,
+    path: str | Path,
+    fmt: str | None = None,
+    compression: str = "zstd",
+    row_group_size: int = _PARQUET_BATCH_ROWS,
 ) -> None:
+    """Write ``df`` without its index as CSV or Parquet.
+
+    ``compression`` and ``row_group_size`` only apply to Parquet output.
+    """
     p = Path(path)
     if fmt is None:
         fmt = p.suffix.lstrip(".").lower()
@@ -15,7 +29,26 @@ def write_table(
     if fmt == "csv":
         df.to_csv(p, index=False)
     elif fmt in {"parquet", "pq"}:
-        df.to_parquet(p, index=False)
+        _write_parquet(df, p, compression, row_group_size)
     else:
         msg = f"Unsupported output format: {fmt}"
         raise ValueError(msg)
+
+
+def _write_parquet(
+    df: pd.DataFrame, path: Path, compression: str, row_group_size: int
+) -> None:
+    """Write ``df`` as Parquet, one row group per batch of ``row_group_size``.
+
+    ``DataFrame.to_parquet`` converts the whole frame to an Arrow table
+    first; converting slice by slice keeps only one batch in Arrow form. The
+    schema is inferred once from the full frame so that every batch (e.g. one
+    whose object column is all ``None``) is written with the same types.
+    """
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+    with pq.ParquetWriter(path, schema, compression=compression) as writer:
+        for start in range(0, max(len(df), 1), row_group_size):
+            batch = df.iloc[start : start + row_group_size]
+            writer.write_table(
+                pa.Table.from_pandas(batch, schema=schema, preserve_index=False)
+            )
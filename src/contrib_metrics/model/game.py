@@ -9,14 +9,18 @@ from .game_types import GameType
 Coalition = FrozenSet[int]
 
 
-@dataclass
+@dataclass(slots=True)
 class Game:
-    players: list[int]
+    players: tuple[int, ...]
     coalitions: list[Coalition]
     values: Dict[Coalition, float] = field(default_factory=dict)
     ranks: Optional[Dict[Coalition, int]] = None
     game_type: GameType = GameType.TU
 
+    def __post_init__(self) -> None:
+        # The roster is fixed once the game is built.
+        self.players = tuple(self.players)
+
     def value(self, coalition: Iterable[int]) -> float:
         key: Coalition = frozenset(coalition)
         return self.values.get(key, 0.0)
@@ -37,7 +41,7 @@ class Game:
     ) -> "Game":
         coalitions = list(values.keys())
         return cls(
-            players=list(players),
+            players=tuple(players),
             coalitions=coalitions,
             values=dict(values),
             ranks=dict(ranks) if ranks is not None else None,
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-from typing import Iterable, List
+from typing import Any, Iterable, List
 
+import numpy as np
 import pandas as pd
 
 from .game import Coalition, Game
@@ -19,28 +20,31 @@ def build_games_from_table(
 ) -> List[Game]:
     games: list[Game] = []
 
+    # Rows are reordered once so that every (scenario, game) group is a
+    # contiguous block; the columns are then sliced per group.
     group_cols: list[str] = [scenario_column, game_column]
-    for _, g in df.groupby(group_cols):
-        coalitions: list[Coalition] = list(g["coalition"])
+    order, bounds = _group_blocks(df, group_cols)
+    coalition_arr = df["coalition"].to_numpy()[order]
+    value_col = _cast_column(df, value_column, order, np.float64)
+    rank_col = _cast_column(df, rank_column, order, np.int64)
+
+    for lo, hi in zip(bounds[:-1].tolist(), bounds[1:].tolist(), strict=True):
+        block = coalition_arr[lo:hi]
+        coalitions: list[Coalition] = block.tolist()
         players = _infer_players_from_coalitions(coalitions)
         if players_override is not None:
             players.update(int(p) for p in players_override)
 
-        values = {}
-        ranks = {}
-        has_value = value_column in g.columns
-        has_rank = rank_column in g.columns
-
-        for _, row in g.iterrows():
-            c = row["coalition"]
-            if has_value and not pd.isna(row[value_column]):
-                values[c] = float(row[value_column])
-            if has_rank and not pd.isna(row[rank_column]):
-                ranks[c] = int(row[rank_column])
+        values: dict[Coalition, float] = {}
+        ranks: dict[Coalition, int] = {}
+        if value_col is not None:
+            values = _by_coalition(block, value_col, lo, hi)
+        if rank_col is not None:
+            ranks = _by_coalition(block, rank_col, lo, hi)
 
         ranks_dict = ranks if ranks else None
         game = Game(
-            players=sorted(players),
+            players=tuple(sorted(players)),
             coalitions=coalitions,
             values=values,
             ranks=ranks_dict,
@@ -51,6 +55,58 @@ def build_games_from_table(
     return games
 
 
+def _group_blocks(
+    df: pd.DataFrame, group_cols: list[str]
+) -> tuple[np.ndarray, np.ndarray]:
+    """Row order that makes each group contiguous, and the block boundaries.
+
+    Same groups in the same order as ``df.groupby(group_cols)``: keys are
+    factorized in sorted order, rows with a missing key are dropped and rows
+    keep their table order within a group (``np.lexsort`` is stable).
+    """
+    codes = [pd.factorize(df[col], sort=True)[0] for col in group_cols]
+    rows = np.flatnonzero(np.logical_and.reduce([c >= 0 for c in codes]))
+    order = rows[np.lexsort([c[rows] for c in reversed(codes)])]
+    if not len(order):
+        return order, np.zeros(1, dtype=np.intp)
+
+    change = np.zeros(len(order) - 1, dtype=bool)
+    for c in codes:
+        change |= np.diff(c[order]) != 0
+    bounds = np.concatenate(([0], np.flatnonzero(change) + 1, [len(order)]))
+    return order, bounds
+
+
+def _cast_column(
+    df: pd.DataFrame, column: str, order: np.ndarray, dtype: type
+) -> tuple[np.ndarray, np.ndarray] | None:
+    """(present, values) of ``column`` in ``order``, or None if it is absent.
+
+    The present entries are cast at once (``int`` truncation / ``float``
+    parsing as with the scalar casts); missing ones are left at 0.
+    """
+    if column not in df.columns:
+        return None
+    series = df[column]
+    present = series.notna().to_numpy()[order]
+    raw = series.to_numpy()[order]
+    values = np.zeros(len(order), dtype=dtype)
+    values[present] = raw[present].astype(dtype)
+    return present, values
+
+
+def _by_coalition(
+    block: np.ndarray, column: tuple[np.ndarray, np.ndarray], lo: int, hi: int
+) -> dict[Coalition, Any]:
+    """{coalition: value} over the rows lo:hi where the column is present.
+
+    Later rows win for a repeated coalition.
+    """
+    present = column[0][lo:hi]
+    values = column[1][lo:hi]
+    return dict(zip(block[present].tolist(), values[present].tolist(), strict=True))
+
+
 def _infer_players_from_coalitions(coalitions: Iterable[Coalition]) -> set[int]:
     players: set[int] = set()
     for c in coalitions:
@@ -88,27 +144,59 @@ def add_rank_from_value(
         msg = f"Columns {group_cols} must be present to compute ranks."
         raise ValueError(msg)
 
-    work = df.copy()
-    target_col = value_column
+    values = df[value_column].to_numpy(dtype=np.float64, na_value=np.nan)
 
     method_normalized = method.lower()
     if method_normalized == "bin":
         if bin_width is None or bin_width <= 0:
             msg = "bin_width must be positive when method='bin'."
             raise ValueError(msg)
-        # Discretize values into integer buckets before ranking.
-        work["_bucket_for_rank"] = (work[value_column] / bin_width).floordiv(1)
-        target_col = "_bucket_for_rank"
+        # Discretize values into integer buckets before ranking. floor(v / w)
+        # rather than np.floor_divide, which rounds some quotients down a step.
+        values = np.floor(values / bin_width)
     elif method_normalized != "dense":
         msg = f"Unknown ranking method: {method}"
         raise ValueError(msg)
 
-    ranks = (
-        work.groupby(group_cols)[target_col]
-        .rank(method="dense", ascending=not descending)
-        .astype("Int64")
-    )
+    ranks, ranked = _dense_rank_within_groups(df, group_cols, values, descending)
 
-    result = df.copy()
-    result[rank_column] = ranks
+    # Only the rank column is new; the other columns are shared with ``df``.
+    result = df.copy(deep=False)
+    result[rank_column] = pd.arrays.IntegerArray(ranks, ~ranked)
     return result
+
+
+def _dense_rank_within_groups(
+    df: pd.DataFrame, group_cols: list[str], values: np.ndarray, descending: bool
+) -> tuple[np.ndarray, np.ndarray]:
+    """Dense rank of ``values`` within each group, and where it is defined.
+
+    Matches ``groupby(group_cols).rank(method="dense")``: rows with a missing
+    key or value are left unranked. One lexsort on (group, value) replaces the
+    per-group rank calls; a rank increases wherever the value changes inside a
+    group.
+    """
+    ranks = np.zeros(len(df), dtype=np.int64)
+    gid = np.zeros(len(df), dtype=np.int64)
+    for col in group_cols:
+        codes, uniques = pd.factorize(df[col])
+        gid = np.where((codes < 0) | (gid < 0), -1, gid * len(uniques) + codes)
+    ranked = (gid >= 0) & ~np.isnan(values)
+    rows = np.flatnonzero(ranked)
+    if not len(rows):
+        return ranks, ranked
+
+    key = values[rows]
+    order = rows[np.lexsort((-key if descending else key, gid[rows]))]
+    gid = gid[order]
+    key = values[order]
+
+    new_group = np.empty(len(order), dtype=bool)
+    new_group[0] = True
+    np.not_equal(gid[1:], gid[:-1], out=new_group[1:])
+    new_value = new_group.copy()
+    new_value[1:] |= key[1:] != key[:-1]
+    # Running count of distinct values, restarted at each group's first row.
+    seen = np.cumsum(new_value)
+    ranks[order] = seen - np.maximum.accumulate(np.where(new_group, seen, 0)) + 1
+    return ranks, ranked
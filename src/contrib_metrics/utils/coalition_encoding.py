@@ -1,56 +1,72 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Iterable, FrozenSet
+from functools import lru_cache
+from typing import Any, Callable, FrozenSet, Iterable
 
 
 def normalize_coalition(value: Any) -> FrozenSet[int]:
-    if isinstance(value, frozenset):
-        return frozenset(int(x) for x in value)
-    if isinstance(value, set):
-        return frozenset(int(x) for x in value)
-    if isinstance(value, list):
-        return frozenset(int(x) for x in value)
-    if isinstance(value, int):
-        return _from_bitmask(value)
-    if isinstance(value, str):
-        s = value.strip()
-        if not s:
-            return frozenset()
-        # tuple-like string e.g. "('0','1')" or "(0,1)"
-        if s.startswith("(") and s.endswith(")"):
-            inner = s.strip("()").strip()
-            if not inner:
-                return frozenset()
-            cleaned = []
-            for part in inner.split(","):
-                part = part.strip().strip("'").strip('"')
-                if part:
-                    cleaned.append(int(part))
-            return frozenset(cleaned)
-        if s.startswith("{") and s.endswith("}"):
-            inner = s.strip("{}").strip()
-            if not inner:
-                return frozenset()
-            return frozenset(int(x.strip()) for x in inner.split(","))
-        if s.startswith("[") and s.endswith("]"):
-            parsed = json.loads(s)
-            if isinstance(parsed, list):
-                return frozenset(int(x) for x in parsed)
-        if set(s) <= {"0", "1"}:
-            return _from_bitstring(s)
-        return frozenset(int(x.strip()) for x in s.split(",") if x.strip())
+    parse = _PARSERS.get(type(value))
+    if parse is None:
+        # Subclasses (bool, str subclasses, ...) take their base type's parser.
+        parse = next((p for t, p in _PARSERS.items() if isinstance(value, t)), _empty)
+    return parse(value)
+
+
+def _from_members(value: Iterable[Any]) -> FrozenSet[int]:
+    return frozenset(map(int, value))
+
+
+def _from_frozenset(value: FrozenSet[Any]) -> FrozenSet[int]:
+    # A frozenset of ints is already normalized; reuse it instead of copying.
+    if type(value) is frozenset and all(type(x) is int for x in value):
+        return value
+    return _from_members(value)
+
+
+def _empty(value: Any) -> FrozenSet[int]:
     return frozenset()
 
 
+# The same coalition string recurs in every game of a table, so parsed strings
+# are memoised; the frozensets returned are immutable and safe to share.
+@lru_cache(maxsize=1 << 16)
+def _parse_str(value: str) -> FrozenSet[int]:
+    s = value.strip()
+    if not s:
+        return frozenset()
+    # tuple-like string e.g. "('0','1')" or "(0,1)"
+    if s.startswith("(") and s.endswith(")"):
+        inner = s.strip("()").strip()
+        if not inner:
+            return frozenset()
+        cleaned = []
+        for part in inner.split(","):
+            part = part.strip().strip("'").strip('"')
+            if part:
+                cleaned.append(int(part))
+        return frozenset(cleaned)
+    if s.startswith("{") and s.endswith("}"):
+        inner = s.strip("{}").strip()
+        if not inner:
+            return frozenset()
+        return frozenset(int(x.strip()) for x in inner.split(","))
+    if s.startswith("[") and s.endswith("]"):
+        parsed = json.loads(s)
+        if isinstance(parsed, list):
+            return frozenset(int(x) for x in parsed)
+    if set(s) <= {"0", "1"}:
+        return _from_bitstring(s)
+    return frozenset(int(x.strip()) for x in s.split(",") if x.strip())
+
+
 def _from_bitmask(mask: int) -> FrozenSet[int]:
-    players: set[int] = set()
-    i = 0
+    # Visit set bits only: ``mask & -mask`` isolates the lowest one.
+    players: list[int] = []
     while mask:
-        if mask & 1:
-            players.add(i)
-        mask >>= 1
-        i += 1
+        low = mask & -mask
+        players.append(low.bit_length() - 1)
+        mask ^= low
     return frozenset(players)
 
 
@@ -60,3 +76,14 @@ def _from_bitstring(bits: str) -> FrozenSet[int]:
         if b == "1":
             players.add(i)
     return frozenset(players)
+
+
+# Parser per input type, looked up by exact type first; the order is the
+# isinstance order used for subclasses.
+_PARSERS: dict[type, Callable[[Any], FrozenSet[int]]] = {
+    frozenset: _from_frozenset,
+    set: _from_members,
+    list: _from_members,
+    int: _from_bitmask,
+    str: _parse_str,
+}
@@ -1,12 +1,16 @@
 from __future__ import annotations
 
+import copy
 import logging
 import logging.config
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Mapping
 
 import yaml
 
+from .yaml_compat import SafeLoader
+
 
 def configure_logging(config_path: Path | None = None) -> None:
     if config_path is None or not config_path.exists():
@@ -16,9 +20,16 @@ def configure_logging(config_path: Path | None = None) -> None:
         )
         return
 
-    with config_path.open("r", encoding="utf-8") as f:
-        config: Mapping[str, Any] = yaml.safe_load(f)
-    logging.config.dictConfig(config)
+    config = _load_config(config_path.resolve(), config_path.stat().st_mtime_ns)
+    # dictConfig consumes keys of the nested dicts, so it gets its own copy.
+    logging.config.dictConfig(copy.deepcopy(config))
+
+
+@lru_cache(maxsize=4)
+def _load_config(path: Path, mtime_ns: int) -> Mapping[str, Any]:
+    # ``mtime_ns`` is only part of the cache key: an edited file is re-read.
+    with path.open("r", encoding="utf-8") as f:
+        return yaml.load(f, Loader=SafeLoader)
 
 
 def get_logger(name: str) -> logging.Logger:
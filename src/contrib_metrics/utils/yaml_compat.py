@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+# libyaml が使える環境では C 実装のローダ／ダンパを使う（挙動は Safe* と同じ）
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeDumper, SafeLoader
+
+__all__ = ["SafeDumper", "SafeLoader"]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from contrib_metrics.aggregation.axioms import update_sada_counts, update_swimmy_counts
+from contrib_metrics.model.game import Game
+
+
+def _game() -> Game:
+    ranks = {
+        frozenset({1}): 2,
+        frozenset({2}): 3,
+        frozenset({3}): 1,
+        frozenset({1, 2}): 1,
+        frozenset({1, 3}): 3,
+        frozenset({2, 3}): 2,
+    }
+    return Game(players=[1, 2, 3], coalitions=list(ranks), ranks=ranks)
+
+
+RULES = {
+    "score": {
+        frozenset({1, 2}): 3.0,
+        frozenset({1, 3}): 1.0,
+        frozenset({2, 3}): 2.0,
+    },
+    "score_rank": {
+        frozenset({1, 2}): 1.0,
+        frozenset({1, 3}): 2.0,
+        frozenset({2, 3}): 3.0,
+    },
+}
+
+
+def test_axiom_counts_accumulate_across_games() -> None:
+    swimmy: dict[str, dict[str, int]] = {}
+    sada: dict[str, dict[str, int]] = {}
+
+    # The second call reuses the cached pair layout for the same roster.
+    for _ in range(2):
+        game = _game()
+        update_swimmy_counts(game, RULES, swimmy)
+        update_sada_counts(game, RULES, sada)
+
+    expected = {
+        "score": {"triggered": 6, "satisfied": 6},
+        "score_rank": {"triggered": 6, "satisfied": 4},
+    }
+    assert swimmy == expected
+    assert sada == expected
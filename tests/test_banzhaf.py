@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from itertools import combinations
+
+from contrib_metrics.indices.banzhaf import compute_banzhaf
+from contrib_metrics.model.game import Game
+
+
+def test_banzhaf_null_player_is_exactly_zero() -> None:
+    # v(S) = 0.1 + 0.3 * [1 in S]: player 1 adds 0.3 everywhere, 2 and 3 are null.
+    players = [1, 2, 3]
+    coalitions = [
+        frozenset(c) for k in range(len(players) + 1) for c in combinations(players, k)
+    ]
+    values = {c: 0.1 + (0.3 if 1 in c else 0.0) for c in coalitions}
+    game = Game(players=players, coalitions=coalitions, values=values)
+
+    raw = compute_banzhaf(game, normalize=False)
+    assert abs(raw[1] - 4 * 0.3) < 1e-12
+    assert raw[2] == 0.0
+    assert raw[3] == 0.0
+
+    assert compute_banzhaf(game) == {1: 1.0, 2: 0.0, 3: 0.0}
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pandas as pd
+
 from contrib_metrics.cli import main
 
 
@@ -43,3 +45,50 @@ indices:
     base_dir = Path("outputs") / data.parent / data.stem
     individuals = base_dir / "tables" / "individuals.csv"
     assert individuals.exists()
+
+
+def test_cli_interactions_with_sparse_player_ids(tmp_path: Path) -> None:
+    cfg = tmp_path / "config.yaml"
+    data = tmp_path / "game.csv"
+    out = tmp_path / "out"
+
+    players = [-3, 7, 1000001]
+    rows = ["scenario_id,game_id,coalition,value"]
+    for mask in range(1, 8):
+        members = [p for k, p in enumerate(players) if mask >> k & 1]
+        rows.append(f'1,1,"{{{",".join(map(str, members))}}}",{mask}.0')
+    data.write_text("\n".join(rows) + "\n", encoding="utf-8")
+
+    cfg.write_text(
+        f"""
+input:
+  path: {data}
+  format: csv
+  game_type: TU
+indices:
+  interactions:
+    enabled: true
+    shapley: true
+    banzhaf: true
+visualization:
+  enabled: false
+output:
+  path: {out}
+  format: csv
+""",
+        encoding="utf-8",
+    )
+
+    main(["--config", str(cfg)])
+
+    coalitions = pd.read_csv(out / "tables" / "coalitions.csv")["coalition"]
+    # Ordered by size, then numerically by members.
+    assert coalitions.tolist() == [
+        "{-3}",
+        "{7}",
+        "{1000001}",
+        "{-3,7}",
+        "{-3,1000001}",
+        "{7,1000001}",
+        "{-3,7,1000001}",
+    ]
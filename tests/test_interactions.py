@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import math
+from itertools import combinations
+
+from contrib_metrics.indices.interactions import (
+    compute_banzhaf_interaction,
+    compute_interactions,
+    compute_shapley_interaction,
+)
+from contrib_metrics.model.game import Game
+
+
+def _subsets(items: list[int]) -> list[frozenset[int]]:
+    return [
+        frozenset(c) for k in range(len(items) + 1) for c in combinations(items, k)
+    ]
+
+
+def _derivative(values: dict[frozenset[int], float], S, T) -> float:
+    # sum_{L ⊆ S} (-1)^{s-l} v(L ∪ T)
+    return sum(
+        (-1) ** (len(S) - len(L)) * values.get(L | T, 0.0)
+        for L in _subsets(sorted(S))
+    )
+
+
+def test_interactions_match_definition() -> None:
+    players = [2, 5, 7, 11]
+    values = {
+        c: float(len(c) ** 2 + 3 * (5 in c) * (11 in c)) for c in _subsets(players)
+    }
+    del values[frozenset({2, 7})]  # undefined coalitions count as 0
+    game = Game(players=players, coalitions=list(values), values=values)
+
+    shapley = compute_shapley_interaction(game)
+    banzhaf = compute_banzhaf_interaction(game)
+
+    assert compute_interactions(game) == {"shapley": shapley, "banzhaf": banzhaf}
+
+    n = len(players)
+    assert list(shapley) == [S for S in _subsets(players) if S]
+    for S in shapley:
+        rest = [p for p in players if p not in S]
+        s = len(S)
+        expected_shapley = sum(
+            math.factorial(n - len(T) - s)
+            * math.factorial(len(T))
+            / math.factorial(n - s + 1)
+            * _derivative(values, S, T)
+            for T in _subsets(rest)
+        )
+        expected_banzhaf = sum(
+            _derivative(values, S, T) for T in _subsets(rest)
+        ) / 2 ** (n - s)
+        assert math.isclose(shapley[S], expected_shapley, abs_tol=1e-12)
+        assert math.isclose(banzhaf[S], expected_banzhaf, abs_tol=1e-12)
@@ -2,7 +2,11 @@ from __future__ import annotations
 
 from pathlib import Path
 
+import pandas as pd
+
+from contrib_metrics.io import writers
 from contrib_metrics.io.readers import read_game_table
+from contrib_metrics.io.validators import load_schema
 
 
 def test_read_game_table_csv(tmp_path: Path) -> None:
@@ -15,3 +19,48 @@ def test_read_game_table_csv(tmp_path: Path) -> None:
     c = df.loc[0, "coalition"]
     assert isinstance(c, frozenset)
     assert c == frozenset({1, 2})
+
+
+def test_read_game_table_projects_columns(tmp_path: Path) -> None:
+    csv_content = "note,scenario_id,game_id,members,value\nx,1,1,\"{1,2}\",3.0\n"
+    path = tmp_path / "game.csv"
+    path.write_text(csv_content, encoding="utf-8")
+
+    df = read_game_table(
+        path, coalition_column="members", columns=["scenario_id", "game_id", "rank"]
+    )
+    assert list(df.columns) == ["scenario_id", "game_id", "coalition"]
+    assert df.loc[0, "coalition"] == frozenset({1, 2})
+
+
+def test_read_game_table_parquet_list_column(tmp_path: Path) -> None:
+    df = pd.DataFrame(
+        {"scenario_id": [1, 1], "game_id": [1, 1], "coalition": [[1, 2], None]}
+    )
+    path = tmp_path / "game.parquet"
+    df.to_parquet(path)
+
+    coalitions = read_game_table(path)["coalition"].tolist()
+    assert coalitions == [frozenset({1, 2}), frozenset()]
+    assert all(type(p) is int for p in coalitions[0])
+
+    df["coalition"] = [["1", "2"], ["3"]]
+    df.to_parquet(path)
+
+    coalitions = read_game_table(path)["coalition"].tolist()
+    assert coalitions == [frozenset({1, 2}), frozenset({3})]
+    assert all(type(p) is int for c in coalitions for p in c)
+
+
+def test_write_table_parquet_batches(tmp_path: Path) -> None:
+    df = pd.DataFrame({"player": [1, 2, 3], "theta": [None, None, "1,0"]})
+    path = tmp_path / "out.parquet"
+
+    writers.write_table(df, path, row_group_size=2)
+    pd.testing.assert_frame_equal(pd.read_parquet(path), df)
+
+
+def test_load_schema_from_package() -> None:
+    schema = load_schema()
+    assert schema["title"] == "GameTable"
+    assert load_schema() is schema
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from contrib_metrics.indices.shapley import compute_shapley_exact
+import math
+
+from contrib_metrics.indices.shapley import compute_shapley_exact, shapley_weights
 from contrib_metrics.model.game import Game
 from contrib_metrics.model.game_types import GameType
 
@@ -24,3 +26,12 @@ def test_shapley_additive_game() -> None:
 
     phi = compute_shapley_exact(game)
     assert all(abs(phi[p] - 1.0) < 1e-9 for p in players)
+
+
+def test_shapley_weights_sum_to_one() -> None:
+    # Each player's coefficients over all coalitions of the others sum to 1.
+    n = 5
+    weights = shapley_weights(n)
+    assert len(weights) == n
+    total = sum(math.comb(n - 1, s) * w for s, w in enumerate(weights))
+    assert abs(total - 1.0) < 1e-12
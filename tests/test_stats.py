@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import math
+
+import pandas as pd
+
+from contrib_metrics.aggregation.stats import summarize_indices
+
+
+def test_summarize_indices_matches_groupby_mean() -> None:
+    df = pd.DataFrame(
+        {
+            "player": [2, 1, 2, 1, 3],
+            "shapley": [1.0, 2.0, None, 4.0, None],
+            "shapley_rank": [1, 2, 1, 1, 3],
+            "lex_cel_theta": ["1,0", "0,1", "1,0", "0,1", "0,0"],
+        }
+    )
+
+    summary = summarize_indices(df)
+
+    assert summary["player"].tolist() == [1, 2, 3]
+    assert summary["shapley"].tolist()[:2] == [3.0, 1.0]
+    assert math.isnan(summary["shapley"].iloc[2])
+    assert summary["shapley_rank"].tolist() == [1.5, 1.0, 3.0]
+    assert "lex_cel_theta" not in summary.columns